@@ -12,6 +12,7 @@ from rest_framework.response import Response
 from django.db.models import Q, Prefetch
 from django_filters.rest_framework import DjangoFilterBackend
 
+from apps.core.managers import soft_delete_prefetch
 from apps.products.models import (
     Product, ProductVariant, Category, ProductType, ProductImage
 )
@@ -86,7 +87,7 @@ class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
             status='published'
         ).select_related('category', 'product_type').prefetch_related(
             'images',
-            'variants',
+            soft_delete_prefetch('variants', ProductVariant),
             'reviews'
         ).order_by('-created_at')
         
@@ -133,7 +134,7 @@ class ProductViewSet(viewsets.ReadOnlyModelViewSet):
         'product_type'
     ).prefetch_related(
         'images',
-        'variants',
+        soft_delete_prefetch('variants', ProductVariant),
         'attribute_values__attribute',
         'reviews'
     )
@@ -7,10 +7,14 @@ This module provides comprehensive admin interfaces for:
 - Site Settings (grouped by category)
 """
 
+import json
+
+from django import forms
 from django.contrib import admin
 from django.utils.html import format_html
 from django.utils import timezone
 from unfold.admin import ModelAdmin
+from unfold.widgets import UnfoldAdminTextareaWidget
 from .models import Page, Banner, ContactSubmission, SiteSettings
 
 
@@ -71,6 +75,9 @@ class PageAdmin(ModelAdmin):
     
     ordering = ['sort_order', 'title']
     
+    # Ancestor levels joined for tree indentation (covers typical CMS depth)
+    TREE_SELECT_RELATED = ('parent__parent__parent',)
+    
     def get_tree_title(self, obj):
         """Display title with indentation for hierarchy.
         
@@ -123,6 +130,9 @@ class PageAdmin(ModelAdmin):
     def get_queryset(self, request):
         """Get queryset with optimizations.
         
+        get_tree_title walks the parent chain for every row, so the
+        ancestors are joined up front instead of fetched one per level.
+        
         Args:
             request: HTTP request
         
@@ -130,7 +140,7 @@ class PageAdmin(ModelAdmin):
             QuerySet: Optimized queryset
         """
         qs = super().get_queryset(request)
-        return qs.select_related('parent')
+        return qs.select_related(*self.TREE_SELECT_RELATED)
 
 
 @admin.register(Banner)
@@ -185,6 +195,36 @@ class BannerAdmin(ModelAdmin):
     
     actions = ['activate_banners', 'deactivate_banners']
     
+    def get_changelist_instance(self, request):
+        """Build the changelist, stamping its rows with one reference time.
+        
+        timezone.now() is read once per request, so every row's schedule
+        checks agree. Iterating the page fills its result cache, which
+        the template then reuses, so no extra query is made.
+        
+        Args:
+            request: HTTP request
+        
+        Returns:
+            ChangeList: Changelist whose result rows carry list_now
+        """
+        changelist = super().get_changelist_instance(request)
+        now = timezone.now()
+        for banner in changelist.result_list:
+            banner.list_now = now
+        return changelist
+    
+    def _list_now(self, obj):
+        """Get the reference time for list display columns.
+        
+        Args:
+            obj (Banner): Banner instance from the changelist
+        
+        Returns:
+            datetime: The changelist's reference time
+        """
+        return obj.list_now
+    
     def image_preview(self, obj):
         """Display small image preview.
         
@@ -214,7 +254,7 @@ class BannerAdmin(ModelAdmin):
         Returns:
             str: HTML badge for status
         """
-        is_currently_active = obj.is_currently_active()
+        is_currently_active = obj.is_currently_active(now=self._list_now(obj))
         
         if is_currently_active:
             color = '#28a745'
@@ -249,7 +289,7 @@ class BannerAdmin(ModelAdmin):
                 '<span style="color: #999;">No schedule</span>'
             )
         
-        now = timezone.now()
+        now = self._list_now(obj)
         info_parts = []
         
         if obj.start_date:
@@ -415,6 +455,9 @@ class ContactSubmissionAdmin(ModelAdmin):
     def save_model(self, request, obj, form, change):
         """Auto-mark as read when viewing.
         
+        The flag is set in memory so it rides along with the admin's own
+        save instead of issuing a separate UPDATE first.
+        
         Args:
             request: HTTP request
             obj: Model instance
@@ -422,11 +465,45 @@ class ContactSubmissionAdmin(ModelAdmin):
             change: Boolean indicating if this is a change (not add)
         """
         if change and not obj.is_read:
-            obj.mark_as_read()
+            obj.is_read = True
         
         super().save_model(request, obj, form, change)
 
 
+class SiteSettingsAdminForm(forms.ModelForm):
+    """Admin form that edits setting values as plain text.
+    
+    The model stores native JSON; text entered here is converted to the
+    selected value_type when the setting is saved, so editors don't need
+    to quote strings or write JSON for simple values. Text that doesn't
+    parse as the selected type is reported as an error on the value field.
+    """
+    
+    value = forms.CharField(
+        required=False,
+        strip=False,
+        widget=UnfoldAdminTextareaWidget(attrs={'rows': 3}),
+        help_text="Plain text; converted using the selected value type",
+    )
+    
+    class Meta:
+        model = SiteSettings
+        fields = '__all__'
+    
+    def __init__(self, *args, **kwargs):
+        """Show the stored value in its editable text form.
+        
+        JSON values are always encoded, so a JSON string keeps its quotes
+        and parses back to the same value when saved unchanged.
+        """
+        super().__init__(*args, **kwargs)
+        if self.instance.pk:
+            if self.instance.value_type == 'json':
+                self.initial['value'] = json.dumps(self.instance.value)
+            else:
+                self.initial['value'] = self.instance.get_display_value()
+
+
 @admin.register(SiteSettings)
 class SiteSettingsAdmin(ModelAdmin):
     """Admin interface for SiteSettings model.
@@ -468,6 +545,8 @@ class SiteSettingsAdmin(ModelAdmin):
     
     ordering = ['group', 'key']
     
+    form = SiteSettingsAdminForm
+    
     def value_preview(self, obj):
         """Display truncated value preview.
         
@@ -477,7 +556,7 @@ class SiteSettingsAdmin(ModelAdmin):
         Returns:
             str: HTML formatted value preview
         """
-        value = obj.value
+        value = obj.get_display_value()
         
         if len(value) > 50:
             preview = value[:47] + '...'
@@ -0,0 +1,69 @@
+# Generated by Django 5.1.15 on 2026-10-17 12:14
+
+import json
+
+from django.db import migrations, models
+
+
+def _legacy_to_native(value, value_type):
+    """Parse a legacy text value using the pre-JSON get_value rules."""
+    if value_type == "number":
+        try:
+            return int(value) if "." not in value else float(value)
+        except (ValueError, TypeError):
+            return 0
+    if value_type == "boolean":
+        return value.strip().lower() in ("true", "1", "yes", "on")
+    if value_type == "json":
+        try:
+            return json.loads(value)
+        except (json.JSONDecodeError, TypeError):
+            return {}
+    return value
+
+
+def encode_values_as_json(apps, schema_editor):
+    """Rewrite text values as JSON documents so the column cast succeeds."""
+    SiteSettings = apps.get_model("cms", "SiteSettings")
+    settings = list(SiteSettings.objects.all())
+    for setting in settings:
+        setting.value = json.dumps(_legacy_to_native(setting.value, setting.value_type))
+    SiteSettings.objects.bulk_update(settings, ["value"])
+
+
+def decode_values_from_json(apps, schema_editor):
+    """Restore legacy text values (booleans as 'true'/'false')."""
+    SiteSettings = apps.get_model("cms", "SiteSettings")
+    settings = list(SiteSettings.objects.all())
+    for setting in settings:
+        try:
+            value = json.loads(setting.value)
+        except (json.JSONDecodeError, TypeError):
+            continue
+        if isinstance(value, bool):
+            setting.value = "true" if value else "false"
+        elif isinstance(value, (dict, list)):
+            setting.value = json.dumps(value)
+        else:
+            setting.value = str(value)
+    SiteSettings.objects.bulk_update(settings, ["value"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cms", "0002_alter_contactsubmission_reply_content"),
+    ]
+
+    operations = [
+        migrations.RunPython(encode_values_as_json, decode_values_from_json),
+        migrations.AlterField(
+            model_name="sitesettings",
+            name="value",
+            field=models.JSONField(
+                blank=True,
+                default=str,
+                help_text="Setting value (stored as native JSON; text input is converted using value_type)",
+            ),
+        ),
+    ]
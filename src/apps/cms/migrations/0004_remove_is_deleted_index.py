@@ -0,0 +1,31 @@
+# Generated by Django 5.1.15 on 2026-10-17 12:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("cms", "0003_sitesettings_value_json"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="banner",
+            name="is_deleted",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates if this record has been soft-deleted.",
+                verbose_name="Is Deleted",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="page",
+            name="is_deleted",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates if this record has been soft-deleted.",
+                verbose_name="Is Deleted",
+            ),
+        ),
+    ]
@@ -7,13 +7,80 @@ This module contains models for managing website content including:
 - Site-wide settings (key-value configuration)
 """
 
+import json
+
 from django.db import models
 from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
 from django.core.validators import URLValidator
 from apps.core.models import TimeStampedModel, SoftDeleteModel
 
 User = get_user_model()
 
+# String representations treated as True for boolean settings
+_BOOL_TRUE = frozenset({'true', '1', 'yes', 'on'})
+
+
+def _parse_number(value):
+    """Parse a number setting (int when possible, else float).
+    
+    Raises:
+        ValueError: If the text is not a number
+    """
+    if '.' not in value:
+        return int(value)
+    return float(value)
+
+
+def _parse_bool(value):
+    """Parse a stored boolean setting."""
+    return value.strip().lower() in _BOOL_TRUE
+
+
+def _parse_json(value):
+    """Parse a JSON setting.
+    
+    Raises:
+        ValueError: If the text is not valid JSON
+    """
+    return json.loads(value)
+
+
+# value_type -> value stored for blank text (model default, empty admin input)
+_BLANK_VALUES = {
+    'number': 0,
+    'json': {},
+}
+
+# value_type -> parser, resolved once at import time
+_TYPE_HANDLERS = {
+    'string': str,
+    'number': _parse_number,
+    'boolean': _parse_bool,
+    'json': _parse_json,
+}
+
+
+def _coerce_value(value, value_type):
+    """Convert a raw setting value to the native type for value_type.
+    
+    Strings (admin input, legacy text) are parsed with _TYPE_HANDLERS;
+    native Python values are stored as-is. Blank text maps to the type's
+    empty value (0 or {}) rather than being parsed.
+    
+    Raises:
+        ValueError: If text can't be parsed as value_type
+    """
+    if value_type == 'string':
+        return value if isinstance(value, str) else str(value)
+    if isinstance(value, str):
+        if not value.strip() and value_type in _BLANK_VALUES:
+            return _BLANK_VALUES[value_type]
+        return _TYPE_HANDLERS.get(value_type, str)(value)
+    if value_type == 'boolean':
+        return bool(value)
+    return value
+
 
 class Page(SoftDeleteModel):
     """Page model for CMS content.
@@ -254,11 +321,15 @@ class Banner(SoftDeleteModel):
         """String representation of banner."""
         return f"{self.title} ({self.get_position_display()})"
     
-    def is_currently_active(self):
+    def is_currently_active(self, now=None):
         """Check if banner should be displayed now.
         
         Checks is_active flag and date range constraints.
         
+        Args:
+            now (datetime): Reference time (optional). Pass a single value
+                when evaluating many banners to avoid re-reading the clock.
+        
         Returns:
             bool: True if banner should be displayed
         """
@@ -267,7 +338,8 @@ class Banner(SoftDeleteModel):
         if not self.is_active or self.is_deleted:
             return False
         
-        now = timezone.now()
+        if now is None:
+            now = timezone.now()
         
         # Check start date
         if self.start_date and now < self.start_date:
@@ -414,17 +486,20 @@ class SiteSettings(models.Model):
     Flexible configuration system for site-wide settings.
     Supports different value types (string, number, boolean, JSON).
     
+    Values are stored as native JSON, so reads need no parsing. Text
+    input is converted to the declared value_type once, on save.
+    
     Attributes:
         key (str): Setting identifier (unique)
-        value (text): Setting value (type depends on value_type)
-        value_type (str): Type of value stored
+        value (json): Setting value (native str, int, float, bool, dict, list)
+        value_type (str): Type of value stored (used for input coercion and UI)
         group (str): Settings group for organization
         description (str): Human-readable description
     
     Examples:
         - site_name: "My E-Commerce Store"
-        - items_per_page: "20"
-        - enable_reviews: "true"
+        - items_per_page: 20
+        - enable_reviews: true
         - social_links: {"facebook": "...", "twitter": "..."}
     """
     
@@ -451,9 +526,10 @@ class SiteSettings(models.Model):
         help_text="Unique setting identifier (e.g., 'site_name')"
     )
     
-    value = models.TextField(
+    value = models.JSONField(
         blank=True,
-        help_text="Setting value (format depends on value_type)"
+        default=str,
+        help_text="Setting value (stored as native JSON; text input is converted using value_type)"
     )
     
     value_type = models.CharField(
@@ -490,57 +566,68 @@ class SiteSettings(models.Model):
     
     def __str__(self):
         """String representation of setting."""
-        return f"{self.key} = {self.value[:50]}"
+        return f"{self.key} = {self.get_display_value()[:50]}"
+    
+    def clean(self):
+        """Validate that the value can be converted to value_type.
+        
+        Raises:
+            ValidationError: If the value is unparsable text, so typos are
+                reported instead of being saved as 0 or {}
+        """
+        super().clean()
+        try:
+            _coerce_value(self.value, self.value_type)
+        except ValueError:
+            raise ValidationError({
+                'value': f"Enter a valid {self.get_value_type_display().lower()} value."
+            })
+    
+    def save(self, *args, **kwargs):
+        """Save setting, converting raw text to the declared value_type.
+        
+        Raises:
+            ValueError: If the value is text that can't be parsed as
+                value_type; call full_clean() first to get a ValidationError
+        """
+        self.value = _coerce_value(self.value, self.value_type)
+        super().save(*args, **kwargs)
     
     def get_value(self):
         """Get typed value based on value_type.
         
+        Saved values are already native, so this is a plain attribute
+        read; unsaved raw text is converted on the fly. A saved string
+        under a json type is a JSON string value and is returned as-is.
+        
         Returns:
             Typed value (str, int, float, bool, or dict)
+        
+        Raises:
+            ValueError: If unsaved text can't be parsed as value_type
+        """
+        value = self.value
+        if self._state.adding and isinstance(value, str) and self.value_type != 'string':
+            return _coerce_value(value, self.value_type)
+        return value
+    
+    def get_display_value(self):
+        """Get value as editable text.
+        
+        Returns:
+            str: Strings unchanged, everything else JSON-encoded
         """
-        import json
-        
-        if self.value_type == 'number':
-            try:
-                # Try int first
-                if '.' not in self.value:
-                    return int(self.value)
-                # Fall back to float
-                return float(self.value)
-            except (ValueError, TypeError):
-                return 0
-        
-        elif self.value_type == 'boolean':
-            return self.value.lower() in ('true', '1', 'yes', 'on')
-        
-        elif self.value_type == 'json':
-            try:
-                return json.loads(self.value)
-            except (json.JSONDecodeError, TypeError):
-                return {}
-        
-        # Default: return as string
-        return self.value
+        if isinstance(self.value, str):
+            return self.value
+        return json.dumps(self.value)
     
     def set_value(self, new_value):
         """Set value with automatic type conversion.
         
         Args:
-            new_value: Value to set (will be converted to string)
+            new_value: Value to set (native value or text to convert)
         """
-        import json
-        
-        if self.value_type == 'json':
-            if isinstance(new_value, (dict, list)):
-                self.value = json.dumps(new_value)
-            else:
-                self.value = str(new_value)
-        elif self.value_type == 'boolean':
-            # Convert boolean to lowercase string
-            self.value = 'true' if new_value else 'false'
-        else:
-            self.value = str(new_value)
-        
+        self.value = new_value
         self.save(update_fields=['value'])
     
     @classmethod
@@ -577,6 +664,7 @@ class SiteSettings(models.Model):
         setting, created = cls.objects.get_or_create(
             key=key,
             defaults={
+                'value': value,
                 'value_type': value_type,
                 'group': group,
                 'description': description,
@@ -589,6 +677,6 @@ class SiteSettings(models.Model):
             setting.group = group
             if description:
                 setting.description = description
+            setting.set_value(value)
         
-        setting.set_value(value)
         return setting
@@ -9,9 +9,13 @@ This test module validates:
 
 import json
 from datetime import timedelta
-from django.test import TestCase
+from django.contrib import admin
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.test import RequestFactory, TestCase
 from django.utils import timezone
 from django.contrib.auth import get_user_model
+from apps.cms.admin import BannerAdmin, PageAdmin, SiteSettingsAdminForm
 from apps.cms.models import Page, Banner, ContactSubmission, SiteSettings
 
 User = get_user_model()
@@ -20,28 +24,29 @@ User = get_user_model()
 class PageHierarchyTest(TestCase):
     """Test Page model hierarchical functionality."""
     
-    def setUp(self):
-        """Create test page hierarchy."""
-        self.root = Page.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Create test page hierarchy once for the whole class."""
+        cls.root = Page.objects.create(
             title="Home",
             slug="home",
             content="Homepage content",
             status="published"
         )
         
-        self.about = Page.objects.create(
+        cls.about = Page.objects.create(
             title="About Us",
             slug="about",
             content="About content",
-            parent=self.root,
+            parent=cls.root,
             status="published"
         )
         
-        self.team = Page.objects.create(
+        cls.team = Page.objects.create(
             title="Our Team",
             slug="team",
             content="Team content",
-            parent=self.about,
+            parent=cls.about,
             status="published"
         )
     
@@ -54,12 +59,25 @@ class PageHierarchyTest(TestCase):
         self.assertEqual(breadcrumbs[1].title, "About Us")
         self.assertEqual(breadcrumbs[2].title, "Our Team")
     
+    def test_get_breadcrumbs_query_count(self):
+        """Test breadcrumbs cost one query per uncached ancestor."""
+        team = Page.objects.get(pk=self.team.pk)
+        
+        with self.assertNumQueries(2):
+            breadcrumbs = team.get_breadcrumbs()
+        
+        self.assertEqual(
+            [page.slug for page in breadcrumbs],
+            ["home", "about", "team"]
+        )
+    
     def test_get_children(self):
         """Test get children method."""
-        children = self.root.get_children()
+        with self.assertNumQueries(1):
+            children = list(self.root.get_children())
         
-        self.assertEqual(children.count(), 1)
-        self.assertEqual(children.first().title, "About Us")
+        self.assertEqual(len(children), 1)
+        self.assertEqual(children[0].title, "About Us")
     
     def test_get_depth(self):
         """Test depth calculation."""
@@ -67,6 +85,19 @@ class PageHierarchyTest(TestCase):
         self.assertEqual(self.about.get_depth(), 1)
         self.assertEqual(self.team.get_depth(), 2)
     
+    def test_admin_queryset_joins_ancestors(self):
+        """Test admin tree titles do not query per ancestor level."""
+        request = RequestFactory().get('/admin/cms/page/')
+        page_admin = PageAdmin(Page, admin.site)
+        
+        with self.assertNumQueries(1):
+            depths = {
+                page.slug: page.get_depth()
+                for page in page_admin.get_queryset(request)
+            }
+        
+        self.assertEqual(depths, {"home": 0, "about": 1, "team": 2})
+    
     def test_orphan_children_on_parent_delete(self):
         """Test that children become orphans when parent deleted."""
         self.about.delete()  # Soft delete
@@ -170,6 +201,21 @@ class BannerSchedulingTest(TestCase):
         
         self.assertTrue(banner.is_currently_active())
     
+    def test_banner_explicit_now(self):
+        """Test is_currently_active honors a caller-supplied reference time."""
+        start = timezone.now() + timedelta(days=1)
+        
+        banner = Banner(
+            title="Scheduled Banner",
+            image="banners/test.jpg",
+            position="home_hero",
+            is_active=True,
+            start_date=start
+        )
+        
+        self.assertFalse(banner.is_currently_active())
+        self.assertTrue(banner.is_currently_active(now=start + timedelta(hours=1)))
+    
     def test_banner_soft_delete(self):
         """Test deleted banner is not active."""
         banner = Banner.objects.create(
@@ -187,27 +233,61 @@ class BannerSchedulingTest(TestCase):
         """Test all banner position choices work."""
         positions = ['home_hero', 'home_secondary', 'sidebar', 'footer']
         
-        for position in positions:
-            banner = Banner.objects.create(
+        banners = [
+            Banner(
                 title=f"Banner {position}",
                 image=f"banners/{position}.jpg",
                 position=position,
                 is_active=True
             )
-            self.assertEqual(banner.position, position)
+            for position in positions
+        ]
+        
+        # Choice validation happens in memory; no DB access needed
+        for banner in banners:
+            banner.full_clean(exclude=['image'])
+        
+        Banner.objects.bulk_create(banners)
+        
+        self.assertEqual(
+            set(Banner.objects.values_list('position', flat=True)),
+            set(positions)
+        )
 
+    
+    def test_admin_changelist_shares_reference_time(self):
+        """Test changelist rows share one Python-side reference time."""
+        Banner.objects.bulk_create([
+            Banner(title=f"Banner {i}", image=f"banners/{i}.jpg", is_active=True)
+            for i in range(3)
+        ])
+        request = RequestFactory().get('/admin/cms/banner/')
+        request.user = User.objects.create_superuser(
+            email="admin@example.com",
+            password="adminpass123"
+        )
+        banner_admin = BannerAdmin(Banner, admin.site)
+        
+        changelist = banner_admin.get_changelist_instance(request)
+        
+        self.assertEqual(changelist.queryset.query.annotations, {})
+        self.assertEqual(len({banner.list_now for banner in changelist.result_list}), 1)
+        with self.assertNumQueries(0):
+            badges = [banner_admin.active_badge(banner) for banner in changelist.result_list]
+        self.assertTrue(all("Active" in badge for badge in badges))
 
 class ContactSubmissionTest(TestCase):
     """Test ContactSubmission model functionality."""
     
-    def setUp(self):
-        """Create test user and contact submission."""
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Create test user and contact submission once for the whole class."""
+        cls.user = User.objects.create_user(
             email="admin@example.com",
             password="testpass123"
         )
         
-        self.submission = ContactSubmission.objects.create(
+        cls.submission = ContactSubmission.objects.create(
             name="John Doe",
             email="john@example.com",
             phone="+8801712345678",
@@ -220,7 +300,8 @@ class ContactSubmissionTest(TestCase):
         """Test marking submission as read."""
         self.assertFalse(self.submission.is_read)
         
-        self.submission.mark_as_read()
+        with self.assertNumQueries(1):
+            self.submission.mark_as_read()
         
         self.assertTrue(self.submission.is_read)
     
@@ -230,7 +311,8 @@ class ContactSubmissionTest(TestCase):
         self.assertIsNone(self.submission.reply_content)
         
         reply_text = "Thank you for your inquiry. Our team will contact you soon."
-        self.submission.add_reply(reply_text, self.user)
+        with self.assertNumQueries(1):
+            self.submission.add_reply(reply_text, self.user)
         
         self.assertTrue(self.submission.is_replied)
         self.assertEqual(self.submission.reply_content, reply_text)
@@ -278,8 +360,8 @@ class SiteSettingsTest(TestCase):
     """Test SiteSettings model functionality."""
     
     def test_string_value(self):
-        """Test storing and retrieving string values."""
-        setting = SiteSettings.objects.create(
+        """Test retrieving string values."""
+        setting = SiteSettings(
             key="site_name",
             value="My E-Commerce Store",
             value_type="string",
@@ -289,8 +371,8 @@ class SiteSettingsTest(TestCase):
         self.assertEqual(setting.get_value(), "My E-Commerce Store")
     
     def test_number_integer_value(self):
-        """Test storing and retrieving integer values."""
-        setting = SiteSettings.objects.create(
+        """Test parsing integer values."""
+        setting = SiteSettings(
             key="items_per_page",
             value="20",
             value_type="number",
@@ -302,8 +384,8 @@ class SiteSettingsTest(TestCase):
         self.assertIsInstance(result, int)
     
     def test_number_float_value(self):
-        """Test storing and retrieving float values."""
-        setting = SiteSettings.objects.create(
+        """Test parsing float values."""
+        setting = SiteSettings(
             key="tax_rate",
             value="15.5",
             value_type="number",
@@ -318,31 +400,35 @@ class SiteSettingsTest(TestCase):
         """Test various boolean true representations."""
         true_values = ['true', 'True', '1', 'yes', 'Yes', 'on', 'On']
         
-        for idx, value in enumerate(true_values):
-            setting = SiteSettings.objects.create(
-                key=f"test_bool_{idx}",
-                value=value,
-                value_type="boolean",
-                group="general"
-            )
-            self.assertTrue(setting.get_value(), f"Failed for value: {value}")
+        for value in true_values:
+            with self.subTest(value=value):
+                setting = SiteSettings(
+                    key="test_bool",
+                    value=value,
+                    value_type="boolean",
+                    group="general"
+                )
+                self.assertIs(setting.get_value(), True)
     
     def test_boolean_false_values(self):
         """Test boolean false representations."""
-        setting = SiteSettings.objects.create(
-            key="test_false",
-            value="false",
-            value_type="boolean",
-            group="general"
-        )
-        
-        self.assertFalse(setting.get_value())
+        false_values = ['false', 'False', '0', 'no', 'off', '']
+        
+        for value in false_values:
+            with self.subTest(value=value):
+                setting = SiteSettings(
+                    key="test_false",
+                    value=value,
+                    value_type="boolean",
+                    group="general"
+                )
+                self.assertIs(setting.get_value(), False)
     
     def test_json_value(self):
-        """Test storing and retrieving JSON values."""
+        """Test parsing JSON values."""
         json_data = {"categories": [1, 2, 3], "featured": True}
         
-        setting = SiteSettings.objects.create(
+        setting = SiteSettings(
             key="homepage_config",
             value=json.dumps(json_data),
             value_type="json",
@@ -378,7 +464,7 @@ class SiteSettingsTest(TestCase):
         
         setting.set_value(25)
         
-        self.assertEqual(setting.value, "25")
+        self.assertEqual(setting.value, 25)
         self.assertEqual(setting.get_value(), 25)
     
     def test_set_value_boolean(self):
@@ -392,7 +478,7 @@ class SiteSettingsTest(TestCase):
         
         setting.set_value(True)
         
-        self.assertEqual(setting.value, "true")
+        self.assertIs(setting.value, True)
         self.assertTrue(setting.get_value())
     
     def test_set_value_json(self):
@@ -409,6 +495,94 @@ class SiteSettingsTest(TestCase):
         
         self.assertEqual(setting.get_value(), new_data)
     
+    def test_values_stored_natively(self):
+        """Test text input is converted once on save and read back natively."""
+        SiteSettings.objects.create(
+            key="enable_reviews",
+            value="yes",
+            value_type="boolean",
+            group="shop"
+        )
+        SiteSettings.objects.create(
+            key="items_per_page",
+            value="20",
+            value_type="number",
+            group="shop"
+        )
+        
+        self.assertIs(SiteSettings.objects.get(key="enable_reviews").value, True)
+        self.assertEqual(SiteSettings.objects.get(key="items_per_page").value, 20)
+    
+    def test_unparsable_text_rejected(self):
+        """Test typos in number and JSON values fail validation."""
+        cases = [
+            ("number", "12,5"),
+            ("number", "abc"),
+            ("json", '{"a": 1'),
+        ]
+        for value_type, value in cases:
+            with self.subTest(value_type=value_type, value=value):
+                setting = SiteSettings(
+                    key="typo_setting",
+                    value=value,
+                    value_type=value_type,
+                    group="general"
+                )
+                
+                with self.assertRaises(ValidationError) as ctx:
+                    setting.full_clean()
+                self.assertIn("value", ctx.exception.message_dict)
+                
+                with self.assertRaises(ValueError):
+                    setting.save()
+        
+        self.assertFalse(SiteSettings.objects.exists())
+    
+    def test_admin_form_reports_unparsable_value(self):
+        """Test the admin form shows an error instead of saving a fallback."""
+        form = SiteSettingsAdminForm(data={
+            "key": "social_links",
+            "value": '{"facebook": ',
+            "value_type": "json",
+            "group": "social",
+            "description": "",
+        })
+        
+        self.assertFalse(form.is_valid())
+        self.assertIn("value", form.errors)
+    
+    def test_admin_form_round_trips_json_string(self):
+        """Test an unchanged JSON string value saves back as the same string."""
+        setting = SiteSettings.objects.create(
+            key="tagline",
+            value='"Shop local"',
+            value_type="json",
+            group="general"
+        )
+        form = SiteSettingsAdminForm(instance=setting)
+        self.assertEqual(form.initial["value"], '"Shop local"')
+        
+        data = {name: form.initial.get(name) for name in ("key", "value", "value_type", "group")}
+        data["description"] = ""
+        form = SiteSettingsAdminForm(data=data, instance=setting)
+        
+        self.assertTrue(form.is_valid(), form.errors)
+        form.save()
+        setting.refresh_from_db()
+        self.assertEqual(setting.value, "Shop local")
+    
+    def test_saved_json_string_read_as_is(self):
+        """Test a saved JSON string value isn't parsed again on read."""
+        setting = SiteSettings.objects.create(
+            key="tagline",
+            value='"Shop local"',
+            value_type="json",
+            group="general"
+        )
+        
+        self.assertEqual(SiteSettings.get_setting("tagline"), "Shop local")
+        self.assertEqual(setting.get_value(), "Shop local")
+    
     def test_get_setting_class_method(self):
         """Test get_setting class method."""
         SiteSettings.objects.create(
@@ -438,6 +612,22 @@ class SiteSettingsTest(TestCase):
         setting = SiteSettings.objects.get(key="new_setting")
         self.assertEqual(setting.get_value(), "new_value")
     
+    def test_set_setting_creates_typed_values(self):
+        """Test set_setting creates new number and JSON settings."""
+        SiteSettings.set_setting("items_per_page", 20, value_type="number")
+        SiteSettings.set_setting("social_links", {"a": 1}, value_type="json")
+        
+        self.assertEqual(SiteSettings.get_setting("items_per_page"), 20)
+        self.assertEqual(SiteSettings.get_setting("social_links"), {"a": 1})
+    
+    def test_blank_text_maps_to_empty_value(self):
+        """Test blank number and JSON text saves as 0 and {}."""
+        number = SiteSettings.objects.create(key="blank_number", value_type="number")
+        config = SiteSettings.objects.create(key="blank_json", value="  ", value_type="json")
+        
+        self.assertEqual(number.value, 0)
+        self.assertEqual(config.value, {})
+    
     def test_set_setting_updates_existing(self):
         """Test set_setting updates existing setting."""
         SiteSettings.objects.create(
@@ -464,7 +654,7 @@ class SiteSettingsTest(TestCase):
             group="general"
         )
         
-        with self.assertRaises(Exception):
+        with self.assertRaises(IntegrityError), transaction.atomic():
             SiteSettings.objects.create(
                 key="unique_key",
                 value="value2",
@@ -499,7 +689,7 @@ class PageSEOTest(TestCase):
             status="published"
         )
         
-        with self.assertRaises(Exception):
+        with self.assertRaises(IntegrityError), transaction.atomic():
             Page.objects.create(
                 title="Second Page",
                 slug="unique-slug",
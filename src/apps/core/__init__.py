@@ -12,5 +12,3 @@ Usage:
     from apps.core.managers import SoftDeleteManager
     from apps.core.utils import generate_unique_slug
 """
-
-default_app_config = "apps.core.apps.CoreConfig"
@@ -68,7 +68,7 @@ class BaseModelAdmin(ModelAdmin):
         """
         readonly = list(super().get_readonly_fields(request, obj))
         readonly.extend(self.readonly_fields_base)
-        return tuple(set(readonly))  # Remove duplicates
+        return tuple(dict.fromkeys(readonly))  # Remove duplicates, keep order
 
 
 class TimeStampedAdminMixin:
@@ -90,7 +90,7 @@ class TimeStampedAdminMixin:
         """Add timestamp fields to readonly list."""
         readonly = list(super().get_readonly_fields(request, obj))
         readonly.extend(self.readonly_fields_timestamps)
-        return tuple(set(readonly))
+        return tuple(dict.fromkeys(readonly))
 
 
 class SoftDeleteAdminMixin:
@@ -114,7 +114,7 @@ class SoftDeleteAdminMixin:
         """Add is_deleted to list filters."""
         filters = list(super().get_list_filter(request))
         filters.extend(self.list_filter_soft_delete)
-        return tuple(set(filters))
+        return tuple(dict.fromkeys(filters))
 
     def get_queryset(self, request: HttpRequest) -> QuerySet:
         """
@@ -145,10 +145,7 @@ class SoftDeleteAdminMixin:
             request: The current request.
             queryset: QuerySet of selected records.
         """
-        count = 0
-        for obj in queryset:
-            obj.delete()
-            count += 1
+        count = self.model.bulk_soft_delete(queryset)
 
         self.message_user(request, f"Successfully soft-deleted {count} items.")
 
@@ -161,8 +158,7 @@ class SoftDeleteAdminMixin:
             request: The current request.
             queryset: QuerySet of selected records.
         """
-        count = queryset.filter(is_deleted=True).count()
-        queryset.update(is_deleted=False, deleted_at=None)
+        count = self.model.bulk_restore(queryset)
 
         self.message_user(request, f"Successfully restored {count} items.")
 
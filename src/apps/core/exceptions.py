@@ -29,6 +29,11 @@ class EcomBaseException(Exception):
         message: Human-readable error message.
         code: Machine-readable error code for API responses.
         details: Additional context about the error.
+
+    Note:
+        No __slots__ here: BaseException instances always carry a
+        __dict__, so slots would not save memory, and pickling only
+        restores __dict__ state, so slotted code/details would be lost.
     """
 
     default_message: str = "An error occurred"
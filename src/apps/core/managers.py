@@ -9,6 +9,9 @@ Managers:
     - PublishedManager: Returns only published records
     - SoftDeleteAllManager: Includes soft-deleted records
 
+Helpers:
+    - soft_delete_prefetch: Prefetch that excludes soft-deleted rows
+
 Usage:
     class Product(SoftDeleteModel):
         # Default manager excludes deleted
@@ -21,11 +24,20 @@ Usage:
 
     # Include deleted when needed (admin, restore, etc.)
     Product.all_objects.all()  # All including deleted
+
+Related Managers:
+    Reverse relations (user.orders.all()) are built from the related
+    model's default manager, so declaring SoftDeleteManager first makes
+    them exclude deleted rows too. Forward relations (order.coupon) use
+    the base manager, which must stay unfiltered: Django requires it so
+    that rows pointing at a soft-deleted object can still load it.
+    Do not set Meta.base_manager_name to a SoftDeleteManager.
 """
 
 from typing import TYPE_CHECKING
 
 from django.db import models
+from django.db.models import Prefetch
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
@@ -36,9 +48,44 @@ class SoftDeleteQuerySet(models.QuerySet):
     Custom QuerySet that supports soft-delete operations.
 
     Provides bulk soft-delete and restore operations while maintaining
-    the standard QuerySet interface.
+    the standard QuerySet interface, plus narrow-SELECT helpers for list
+    endpoints that only render a few columns.
     """
 
+    # Columns loaded by only_display(); names missing on a model are skipped.
+    DISPLAY_FIELDS = ("id", "name", "slug", "status")
+
+    def list_view(self, *fields: str) -> "QuerySet":
+        """
+        Return plain dicts of the given fields instead of model instances.
+
+        Skips model construction entirely, which is the cheapest option for
+        list endpoints that serialize a handful of columns.
+
+        Example:
+            Product.objects.all().list_view("id", "name", "slug")
+
+        Args:
+            fields: Field names to select.
+
+        Returns:
+            A values() QuerySet yielding dicts.
+        """
+        return self.values(*fields)
+
+    def only_display(self) -> "QuerySet":
+        """
+        Load only the lightweight display columns (see DISPLAY_FIELDS).
+
+        Heavy columns such as descriptions and SEO text are deferred and
+        fetched lazily only if accessed.
+
+        Returns:
+            QuerySet of model instances with other fields deferred.
+        """
+        names = {field.name for field in self.model._meta.concrete_fields}
+        return self.only(*(name for name in self.DISPLAY_FIELDS if name in names))
+
     def delete(self) -> tuple[int, dict[str, int]]:
         """
         Soft-delete all records in the queryset.
@@ -46,12 +93,13 @@ class SoftDeleteQuerySet(models.QuerySet):
         Instead of actually deleting records, sets is_deleted=True.
         For actual deletion, use hard_delete().
 
+        Runs as a single UPDATE restricted to live rows, so records that
+        are already deleted are not rewritten and keep their deleted_at.
+
         Returns:
             Tuple of (count, {model_label: count}) matching Django's delete signature.
         """
-        from django.utils import timezone
-
-        count = self.update(is_deleted=True, deleted_at=timezone.now())
+        count = self.model.bulk_soft_delete(self)
         return count, {self.model._meta.label: count}
 
     def hard_delete(self) -> tuple[int, dict[str, int]]:
@@ -72,7 +120,42 @@ class SoftDeleteQuerySet(models.QuerySet):
         Returns:
             Number of records restored.
         """
-        return self.update(is_deleted=False, deleted_at=None)
+        return self.model.bulk_restore(self)
+
+
+def soft_delete_prefetch(
+    lookup: str,
+    model: type[models.Model],
+    select_related: tuple[str, ...] = (),
+    to_attr: str | None = None,
+) -> Prefetch:
+    """
+    Build a Prefetch for a soft-deletable relation that skips deleted rows.
+
+    A plain prefetch_related("variants") loads deleted rows too when the
+    related model's default manager is unfiltered, and narrowing it later
+    with .filter() on the related manager bypasses the prefetch cache and
+    issues one query per parent. Filtering inside the Prefetch keeps it to
+    one query and serves the relation straight from the cache.
+
+    Example:
+        Product.objects.prefetch_related(
+            soft_delete_prefetch("variants", ProductVariant),
+        )
+
+    Args:
+        lookup: Relation name to prefetch.
+        model: Related model (a SoftDeleteModel subclass).
+        select_related: Forward relations to join into the prefetch query.
+        to_attr: Optional attribute to store the result list on.
+
+    Returns:
+        Prefetch object for prefetch_related().
+    """
+    queryset = model._default_manager.filter(is_deleted=False)
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    return Prefetch(lookup, queryset=queryset, to_attr=to_attr)
 
 
 class SoftDeleteManager(models.Manager):
@@ -95,10 +178,19 @@ class SoftDeleteManager(models.Manager):
         """
         Return queryset excluding soft-deleted records.
 
+        The filtered queryset is built once per model/database and cloned
+        on each call, so the is_deleted lookup is not re-resolved on every
+        ORM entry point. The template itself is never evaluated.
+
         Returns:
             QuerySet filtered to exclude is_deleted=True records.
         """
-        return SoftDeleteQuerySet(self.model, using=self._db).filter(is_deleted=False)
+        key = (self.model, self._db)
+        template = getattr(self, "_template", None)
+        if template is None or template[0] != key:
+            queryset = SoftDeleteQuerySet(self.model, using=self._db).filter(is_deleted=False)
+            template = self._template = (key, queryset)
+        return template[1].all()
 
 
 class SoftDeleteAllManager(models.Manager):
@@ -117,6 +209,12 @@ class SoftDeleteAllManager(models.Manager):
 
         # Access deleted products
         Product.all_objects.filter(is_deleted=True)
+
+    Ordering:
+        No ordering is forced here; the model's Meta.ordering applies
+        (["-created_at"] on TimeStampedModel children). created_at carries
+        a B-tree index, so unfiltered admin listings are served by a
+        backward index scan rather than a full sort.
     """
 
     def get_queryset(self) -> "QuerySet":
@@ -141,27 +239,27 @@ class PublishedQuerySet(models.QuerySet):
         Filter to only published records.
 
         Returns:
-            QuerySet of records with status='published'.
+            QuerySet of records with status=Status.PUBLISHED.
         """
-        return self.filter(status="published")
+        return self.filter(status=self.model.Status.PUBLISHED)
 
     def draft(self) -> "QuerySet":
         """
         Filter to only draft records.
 
         Returns:
-            QuerySet of records with status='draft'.
+            QuerySet of records with status=Status.DRAFT.
         """
-        return self.filter(status="draft")
+        return self.filter(status=self.model.Status.DRAFT)
 
     def hidden(self) -> "QuerySet":
         """
         Filter to only hidden records.
 
         Returns:
-            QuerySet of records with status='hidden'.
+            QuerySet of records with status=Status.HIDDEN.
         """
-        return self.filter(status="hidden")
+        return self.filter(status=self.model.Status.HIDDEN)
 
 
 class PublishedManager(models.Manager):
@@ -187,6 +285,6 @@ class PublishedManager(models.Manager):
         Return queryset of only published records.
 
         Returns:
-            QuerySet filtered to status='published'.
+            QuerySet filtered to status=Status.PUBLISHED.
         """
-        return PublishedQuerySet(self.model, using=self._db).filter(status="published")
+        return PublishedQuerySet(self.model, using=self._db).published()
@@ -2,16 +2,31 @@
 Custom security middleware for additional protection.
 
 Provides request logging and suspicious activity detection.
+
+The middlewares are plain new-style callables rather than
+MiddlewareMixin subclasses, so each request pays for one __call__
+instead of the mixin's hook lookups. They are sync-only; Django adapts
+them when running under ASGI.
 """
 
 import logging
+import re
+
 from django.http import HttpResponseForbidden
-from django.utils.deprecation import MiddlewareMixin
 
 logger = logging.getLogger(__name__)
 
+# Endpoints whose attempts and failures are logged
+AUTH_PATHS = frozenset({
+    '/api/v1/auth/login/',
+    '/api/v1/auth/register/',
+})
+
+# Path prefixes treated as the admin panel (tuple form for str.startswith)
+ADMIN_PATH_PREFIXES = ('/admin/',)
+
 
-class SecurityLoggingMiddleware(MiddlewareMixin):
+class SecurityLoggingMiddleware:
     """
     Log security-relevant events.
     
@@ -19,47 +34,73 @@ class SecurityLoggingMiddleware(MiddlewareMixin):
     and other security events.
     """
     
+    def __init__(self, get_response):
+        self.get_response = get_response
+    
+    def __call__(self, request):
+        self.process_request(request)
+        return self.process_response(request, self.get_response(request))
+    
     def process_request(self, request):
         """Log incoming request details."""
         # Log authentication attempts
-        if request.path in ['/api/v1/auth/login/', '/api/v1/auth/register/']:
+        # Guarded so the client IP isn't extracted when INFO is filtered out
+        if request.path in AUTH_PATHS and logger.isEnabledFor(logging.INFO):
             logger.info(
-                f"Auth attempt: {request.method} {request.path} from {self.get_client_ip(request)}"
+                "Auth attempt: %s %s from %s",
+                request.method, request.path, self.get_client_ip(request),
             )
         
         return None
     
     def process_response(self, request, response):
         """Log security-relevant responses."""
+        path = request.path
+        
         # Log failed authentication
-        if request.path in ['/api/v1/auth/login/', '/api/v1/auth/register/']:
+        if path in AUTH_PATHS:
             if response.status_code >= 400:
                 logger.warning(
-                    f"Failed auth: {request.method} {request.path} - "
-                    f"Status {response.status_code} from {self.get_client_ip(request)}"
+                    "Failed auth: %s %s - Status %s from %s",
+                    request.method, path, response.status_code,
+                    self.get_client_ip(request),
                 )
+            return response
+        
+        # Everything below concerns admin only; don't resolve request.user
+        # (a session/user lookup) for other paths or when INFO is filtered out
+        if not path.startswith(ADMIN_PATH_PREFIXES) or not logger.isEnabledFor(logging.INFO):
+            return response
         
         # Log admin access
-        if request.path.startswith('/admin/') and request.user.is_authenticated:
-            if request.user.is_staff:
-                logger.info(
-                    f"Admin access: {request.user.email} - {request.method} {request.path}"
-                )
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_authenticated and user.is_staff:
+            logger.info("Admin access: %s - %s %s", user.email, request.method, path)
         
         return response
     
     @staticmethod
     def get_client_ip(request):
-        """Get client IP address from request."""
+        """Get client IP address from request.
+        
+        The result is cached on the request, so the several middlewares
+        that log it parse X-Forwarded-For only once.
+        """
+        try:
+            return request._client_ip
+        except AttributeError:
+            pass
+        
         x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
         if x_forwarded_for:
             ip = x_forwarded_for.split(',')[0]
         else:
             ip = request.META.get('REMOTE_ADDR')
+        request._client_ip = ip
         return ip
 
 
-class SuspiciousRequestMiddleware(MiddlewareMixin):
+class SuspiciousRequestMiddleware:
     """
     Detect and block suspicious requests.
     
@@ -81,34 +122,51 @@ class SuspiciousRequestMiddleware(MiddlewareMixin):
         'delete from',
     ]
     
+    # All patterns compiled into one case-insensitive alternation, so each
+    # string is scanned once, without allocating a lowercased copy. The
+    # decoded request.path is scanned on purpose: raw PATH_INFO would miss
+    # percent-encoded payloads, and encoding it to bytes costs a copy.
+    SUSPICIOUS_RE = re.compile(
+        '|'.join(map(re.escape, SUSPICIOUS_PATTERNS)),
+        re.IGNORECASE,
+    )
+    
+    def __init__(self, get_response):
+        self.get_response = get_response
+    
+    def __call__(self, request):
+        response = self.process_request(request)
+        if response is None:
+            response = self.get_response(request)
+        return response
+    
     def process_request(self, request):
         """Check for suspicious patterns."""
         # Check URL path
-        path_lower = request.path.lower()
+        if self.SUSPICIOUS_RE.search(request.path):
+            logger.error(
+                "Suspicious request blocked: %s from %s",
+                request.path, SecurityLoggingMiddleware.get_client_ip(request),
+            )
+            return HttpResponseForbidden("Suspicious request detected")
         
-        for pattern in self.SUSPICIOUS_PATTERNS:
-            if pattern in path_lower:
-                logger.error(
-                    f"Suspicious request blocked: {request.path} from "
-                    f"{SecurityLoggingMiddleware.get_client_ip(request)}"
-                )
-                return HttpResponseForbidden("Suspicious request detected")
+        # Nothing else to scan without a query string
+        if not request.META.get('QUERY_STRING'):
+            return None
         
         # Check query parameters
         for key, value in request.GET.items():
-            value_lower = str(value).lower()
-            for pattern in self.SUSPICIOUS_PATTERNS:
-                if pattern in value_lower:
-                    logger.error(
-                        f"Suspicious query parameter: {key}={value} from "
-                        f"{SecurityLoggingMiddleware.get_client_ip(request)}"
-                    )
-                    return HttpResponseForbidden("Suspicious request detected")
+            if self.SUSPICIOUS_RE.search(value):
+                logger.error(
+                    "Suspicious query parameter: %s=%s from %s",
+                    key, value, SecurityLoggingMiddleware.get_client_ip(request),
+                )
+                return HttpResponseForbidden("Suspicious request detected")
         
         return None
 
 
-class AdminIPWhitelistMiddleware(MiddlewareMixin):
+class AdminIPWhitelistMiddleware:
     """
     Optional: Restrict admin access to specific IP addresses.
     
@@ -116,12 +174,21 @@ class AdminIPWhitelistMiddleware(MiddlewareMixin):
     ADMIN_ALLOWED_IPS in settings.
     """
     
+    def __init__(self, get_response):
+        self.get_response = get_response
+    
+    def __call__(self, request):
+        response = self.process_request(request)
+        if response is None:
+            response = self.get_response(request)
+        return response
+    
     def process_request(self, request):
         """Check if admin access from allowed IP."""
         from django.conf import settings
         
         # Only check admin paths
-        if not request.path.startswith('/admin/'):
+        if not request.path.startswith(ADMIN_PATH_PREFIXES):
             return None
         
         # Get allowed IPs from settings (if configured)
@@ -137,7 +204,7 @@ class AdminIPWhitelistMiddleware(MiddlewareMixin):
         # Check if IP allowed
         if client_ip not in allowed_ips:
             logger.warning(
-                f"Admin access denied for IP: {client_ip} - Path: {request.path}"
+                "Admin access denied for IP: %s - Path: %s", client_ip, request.path
             )
             return HttpResponseForbidden(
                 "Access to admin panel is restricted."
@@ -57,8 +57,10 @@ class TimeStampedModel(models.Model):
         """
         Save the model instance.
 
-        Ensures updated_at is always refreshed, even in bulk operations
-        where auto_now might not trigger.
+        Ensures updated_at is always refreshed. Django sets auto_now
+        fields in pre_save but does not add them to an explicit
+        update_fields, so save(update_fields=[...]) would otherwise
+        leave updated_at stale in the database.
 
         Args:
             *args: Positional arguments passed to parent save().
@@ -66,10 +68,8 @@ class TimeStampedModel(models.Model):
         """
         # If update_fields is specified, ensure updated_at is included
         update_fields = kwargs.get("update_fields")
-        if update_fields is not None:
-            update_fields = set(update_fields)
-            update_fields.add("updated_at")
-            kwargs["update_fields"] = list(update_fields)
+        if update_fields is not None and "updated_at" not in update_fields:
+            kwargs["update_fields"] = [*update_fields, "updated_at"]
 
         super().save(*args, **kwargs)
 
@@ -91,6 +91,13 @@ class SoftDeleteModel(TimeStampedModel):
         - Use SoftDeleteManager as default to auto-exclude deleted records
         - Use SoftDeleteAllManager to include deleted records when needed
 
+    Index Notes:
+        is_deleted is not indexed on its own: nearly every row is False, so
+        a full B-tree on it is large and rarely chosen by the planner.
+        Concrete models should add partial indexes for their hot list
+        queries instead, e.g.
+        models.Index(fields=["-created_at"], condition=Q(is_deleted=False), ...).
+
     Example:
         class Product(SoftDeleteModel):
             objects = SoftDeleteManager()      # Excludes deleted
@@ -108,7 +115,6 @@ class SoftDeleteModel(TimeStampedModel):
     is_deleted = models.BooleanField(
         verbose_name="Is Deleted",
         default=False,
-        db_index=True,
         help_text="Indicates if this record has been soft-deleted.",
     )
 
@@ -123,28 +129,71 @@ class SoftDeleteModel(TimeStampedModel):
     class Meta:
         abstract = True
 
-    def delete(self, using: Any = None, keep_parents: bool = False) -> tuple[int, dict[str, int]]:
+    def delete(
+        self, using: Any = None, keep_parents: bool = False, now: Any = None
+    ) -> tuple[int, dict[str, int]]:
         """
         Soft-delete this record.
 
         Sets is_deleted=True and records the deletion timestamp.
         Does NOT permanently remove the record from the database.
 
-        For permanent deletion, use hard_delete().
+        For permanent deletion, use hard_delete(). To delete many records,
+        prefer bulk_soft_delete().
 
         Args:
             using: Database alias to use.
             keep_parents: Whether to keep parent links (unused in soft-delete).
+            now: Deletion timestamp (optional). Pass one value when deleting
+                several records so the clock is read once.
 
         Returns:
             Tuple of (1, {model_label: 1}) to match Django's delete signature.
         """
         self.is_deleted = True
-        self.deleted_at = timezone.now()
+        self.deleted_at = now if now is not None else timezone.now()
         self.save(update_fields=["is_deleted", "deleted_at", "updated_at"])
 
         return 1, {self._meta.label: 1}
 
+    @classmethod
+    def bulk_soft_delete(cls, queryset: models.QuerySet) -> int:
+        """
+        Soft-delete every live record in a queryset with one UPDATE.
+
+        Use instead of calling delete() on each instance in a loop.
+        Works with any queryset of this model, including ones from a
+        plain models.Manager.
+
+        Args:
+            queryset: Records to soft-delete.
+
+        Returns:
+            Number of records soft-deleted.
+
+        Example:
+            ProductVariant.bulk_soft_delete(product.variants.all())
+        """
+        now = timezone.now()
+        return queryset.filter(is_deleted=False).update(
+            is_deleted=True, deleted_at=now, updated_at=now
+        )
+
+    @classmethod
+    def bulk_restore(cls, queryset: models.QuerySet) -> int:
+        """
+        Restore every soft-deleted record in a queryset with one UPDATE.
+
+        Args:
+            queryset: Records to restore.
+
+        Returns:
+            Number of records restored.
+        """
+        return queryset.filter(is_deleted=True).update(
+            is_deleted=False, deleted_at=None, updated_at=timezone.now()
+        )
+
     def hard_delete(self, using: Any = None, keep_parents: bool = False) -> tuple[int, dict[str, int]]:
         """
         Permanently delete this record from the database.
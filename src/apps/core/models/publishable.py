@@ -32,12 +32,20 @@ class PublishableModel(TimeStampedModel):
         published → Live and visible to users
         hidden → Was published but now hidden (e.g., out of season)
 
+    Index Notes:
+        status is stored as a small integer (see Status) rather than a
+        varchar, keeping comparisons and any index on it narrow. It is
+        not indexed on its own. Meta provides a partial index on
+        published_at covering only published rows, which matches the
+        PublishedManager query shape. Child models that declare their own
+        Meta should extend PublishableModel.Meta to keep it.
+
     Example:
         class Product(PublishableModel):
             name = models.CharField(max_length=255)
 
         # Create as draft
-        product = Product.objects.create(name="T-Shirt", status="draft")
+        product = Product.objects.create(name="T-Shirt", status=Product.Status.DRAFT)
 
         # Publish
         product.publish()
@@ -46,19 +54,17 @@ class PublishableModel(TimeStampedModel):
         product.hide()
     """
 
-    class Status(models.TextChoices):
+    class Status(models.IntegerChoices):
         """Publication status choices."""
 
-        DRAFT = "draft", "Draft"
-        PUBLISHED = "published", "Published"
-        HIDDEN = "hidden", "Hidden"
+        DRAFT = 0, "Draft"
+        PUBLISHED = 1, "Published"
+        HIDDEN = 2, "Hidden"
 
-    status = models.CharField(
+    status = models.PositiveSmallIntegerField(
         verbose_name="Status",
-        max_length=20,
         choices=Status.choices,
         default=Status.DRAFT,
-        db_index=True,
         help_text="Publication status of this content.",
     )
 
@@ -72,8 +78,15 @@ class PublishableModel(TimeStampedModel):
 
     class Meta:
         abstract = True
-
-    def publish(self, commit: bool = True) -> None:
+        indexes = [
+            models.Index(
+                fields=["-published_at"],
+                condition=models.Q(status=1),  # Status.PUBLISHED
+                name="%(app_label)s_%(class)s_pub",
+            ),
+        ]
+
+    def publish(self, commit: bool = True, now: Any = None) -> None:
         """
         Publish this content, making it visible to users.
 
@@ -82,6 +95,8 @@ class PublishableModel(TimeStampedModel):
 
         Args:
             commit: If True, saves the model after updating. Defaults to True.
+            now: Publication timestamp (optional). Pass one value when
+                publishing several records so the clock is read once.
 
         Example:
             product.publish()  # Immediately visible
@@ -89,7 +104,7 @@ class PublishableModel(TimeStampedModel):
         self.status = self.Status.PUBLISHED
 
         if self.published_at is None:
-            self.published_at = timezone.now()
+            self.published_at = now if now is not None else timezone.now()
 
         if commit:
             self.save(update_fields=["status", "published_at", "updated_at"])
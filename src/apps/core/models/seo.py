@@ -7,11 +7,16 @@ fields including slug, meta title, and meta description.
 Use for any content that needs SEO optimization and URL slugs.
 """
 
-from typing import Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from django.db import models
 
 from apps.core.models.base import TimeStampedModel
+from apps.core.utils import generate_unique_slug, generate_unique_slugs
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
 
 
 class SEOModel(TimeStampedModel):
@@ -67,6 +72,46 @@ class SEOModel(TimeStampedModel):
     class Meta:
         abstract = True
 
+    @classmethod
+    def bulk_prepare_slugs(cls, instances: list["SEOModel"]) -> None:
+        """
+        Assign unique slugs to unsaved instances before bulk_create().
+
+        bulk_create() bypasses save(), so slugs are not auto-generated.
+        This fills in every blank slug with at most two queries for the
+        whole batch, instead of one uniqueness check per row.
+
+        Args:
+            instances: Instances of this model; ones with a slug are kept.
+
+        Example:
+            products = [Product(name=name) for name in names]
+            Product.bulk_prepare_slugs(products)
+            Product.objects.bulk_create(products)
+        """
+        pending = [obj for obj in instances if not obj.slug and obj.get_slug_source()]
+        slugs = generate_unique_slugs(cls, [obj.get_slug_source() for obj in pending])
+        for obj, slug in zip(pending, slugs):
+            obj.slug = slug
+
+    @classmethod
+    def list_queryset(cls) -> "QuerySet":
+        """
+        Return the default queryset without the meta_description column.
+
+        Use for listings that only need the slug and title, such as
+        sitemaps or link lists; the description is loaded lazily if a
+        row ever accesses it.
+
+        Returns:
+            QuerySet with meta_description deferred.
+
+        Example:
+            for product in Product.list_queryset():
+                urls.append(product.slug)
+        """
+        return cls._default_manager.defer("meta_description")
+
     def get_slug_source(self) -> str:
         """
         Return the value to use for slug generation.
@@ -90,15 +135,18 @@ class SEOModel(TimeStampedModel):
 
         If slug is not provided, generates one from get_slug_source().
         Uses the generate_unique_slug utility to ensure uniqueness.
+        Partial saves whose update_fields exclude slug skip generation,
+        since the generated value would not be written anyway.
 
         Args:
             *args: Positional arguments passed to parent save().
             **kwargs: Keyword arguments passed to parent save().
         """
-        # Auto-generate slug if not provided
-        if not self.slug:
-            from apps.core.utils import generate_unique_slug
+        update_fields = kwargs.get("update_fields")
+        slug_saved = update_fields is None or "slug" in update_fields
 
+        # Auto-generate slug if not provided
+        if not self.slug and slug_saved:
             source = self.get_slug_source()
             if source:
                 self.slug = generate_unique_slug(
@@ -110,6 +158,9 @@ class SEOModel(TimeStampedModel):
 
         super().save(*args, **kwargs)
 
+        # Rebuild seo_data from the saved values on next access
+        self.__dict__.pop("seo_data", None)
+
     def get_meta_title(self) -> str:
         """
         Get the effective meta title.
@@ -137,12 +188,13 @@ class SEOModel(TimeStampedModel):
         """
         return self.meta_description or ""
 
-    @property
+    @cached_property
     def seo_data(self) -> dict[str, str]:
         """
         Get all SEO data as a dictionary.
 
-        Useful for passing to templates or API responses.
+        Useful for passing to templates or API responses. Built once per
+        instance; save() discards the cached copy.
 
         Returns:
             Dictionary with title, description, and slug.
@@ -10,9 +10,10 @@ that needs manual ordering.
 
 from typing import TYPE_CHECKING, Any
 
-from django.db import models
+from django.db import connections, models, router, transaction
+from django.utils import timezone
 
-from apps.core.models.base import TimeStampedModel
+from apps.core.models.base import SoftDeleteModel, TimeStampedModel
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
@@ -32,6 +33,12 @@ class SortableModel(TimeStampedModel):
         By default, adds 'sort_order' to Meta.ordering. Child classes
         can override to add secondary ordering fields.
 
+    Index Notes:
+        sort_order is not indexed on its own. Meta provides a composite
+        index matching the default ordering so list queries can read it
+        in order without a sort step. Child models that declare their own
+        Meta should add an index matching their own ordering.
+
     Example:
         class Category(SortableModel):
             name = models.CharField(max_length=255)
@@ -48,13 +55,18 @@ class SortableModel(TimeStampedModel):
     sort_order = models.PositiveIntegerField(
         verbose_name="Sort Order",
         default=0,
-        db_index=True,
         help_text="Display order. Lower numbers appear first.",
     )
 
     class Meta:
         abstract = True
         ordering = ["sort_order", "-created_at"]
+        indexes = [
+            models.Index(
+                fields=["sort_order", "-created_at"],
+                name="%(app_label)s_%(class)s_sort",
+            ),
+        ]
 
     def move_up(self) -> bool:
         """
@@ -68,19 +80,18 @@ class SortableModel(TimeStampedModel):
         Example:
             category.move_up()  # Now appears before previous item
         """
-        # Find item with next lower sort_order
-        above = (
-            self.__class__.objects.filter(sort_order__lt=self.sort_order)
-            .order_by("-sort_order")
-            .first()
-        )
-
-        if above:
-            # Swap sort_order values
-            above.sort_order, self.sort_order = self.sort_order, above.sort_order
-            above.save(update_fields=["sort_order"])
-            self.save(update_fields=["sort_order"])
-            return True
+        with transaction.atomic():
+            # Find item with next lower sort_order, locking it for the swap
+            above = (
+                self.__class__.objects.select_for_update()
+                .filter(sort_order__lt=self.sort_order)
+                .order_by("-sort_order")
+                .first()
+            )
+
+            if above:
+                self._swap_sort_order(above)
+                return True
 
         return False
 
@@ -96,22 +107,37 @@ class SortableModel(TimeStampedModel):
         Example:
             category.move_down()  # Now appears after next item
         """
-        # Find item with next higher sort_order
-        below = (
-            self.__class__.objects.filter(sort_order__gt=self.sort_order)
-            .order_by("sort_order")
-            .first()
-        )
-
-        if below:
-            # Swap sort_order values
-            below.sort_order, self.sort_order = self.sort_order, below.sort_order
-            below.save(update_fields=["sort_order"])
-            self.save(update_fields=["sort_order"])
-            return True
+        with transaction.atomic():
+            # Find item with next higher sort_order, locking it for the swap
+            below = (
+                self.__class__.objects.select_for_update()
+                .filter(sort_order__gt=self.sort_order)
+                .order_by("sort_order")
+                .first()
+            )
+
+            if below:
+                self._swap_sort_order(below)
+                return True
 
         return False
 
+    def _swap_sort_order(self, other: "SortableModel") -> None:
+        """
+        Swap sort_order with another item in a single UPDATE.
+
+        Args:
+            other: The neighbouring item to swap positions with.
+        """
+        self.__class__.objects.filter(pk__in=[self.pk, other.pk]).update(
+            sort_order=models.Case(
+                models.When(pk=self.pk, then=models.Value(other.sort_order)),
+                models.When(pk=other.pk, then=models.Value(self.sort_order)),
+            ),
+            updated_at=timezone.now(),
+        )
+        self.sort_order, other.sort_order = other.sort_order, self.sort_order
+
     def move_to(self, position: int) -> None:
         """
         Move this item to a specific position.
@@ -128,13 +154,51 @@ class SortableModel(TimeStampedModel):
         self.sort_order = position
         self.save(update_fields=["sort_order"])
 
+    def move_between(
+        self, before: "SortableModel | None", after: "SortableModel | None"
+    ) -> None:
+        """
+        Move this item between two neighbours (e.g. after a drag-and-drop).
+
+        Takes the midpoint when the neighbours leave a gap in sort_order,
+        so only this row is written. Without a gap, items from `after`
+        onwards are shifted down by one in a single UPDATE rather than
+        renumbering the whole list with reorder_all().
+
+        Args:
+            before: Item that should precede this one (None for first).
+            after: Item that should follow this one (None for last).
+
+        Example:
+            category.move_between(first, second)
+        """
+        if after is None:
+            if before is not None:
+                self.move_to(before.sort_order + 1)
+            return
+
+        low = before.sort_order if before is not None else -1
+        high = after.sort_order
+
+        with transaction.atomic():
+            if high - low > 1:
+                position = (low + high) // 2
+            else:
+                # No room: open a slot at `after` by shifting the tail
+                self.__class__.objects.filter(sort_order__gte=high).exclude(pk=self.pk).update(
+                    sort_order=models.F("sort_order") + 1
+                )
+                position = high
+            self.move_to(position)
+
     @classmethod
     def reorder_all(cls, ordered_pks: list[int]) -> None:
         """
         Reorder all items based on a list of primary keys.
 
         Assigns sort_order values (0, 1, 2, ...) based on the
-        order of IDs in the list.
+        order of IDs in the list, using one executemany call.
+        Rows of soft-delete models that are deleted are left untouched.
 
         Args:
             ordered_pks: List of primary keys in desired order.
@@ -145,8 +209,25 @@ class SortableModel(TimeStampedModel):
             # Category 1 gets sort_order=1
             # etc.
         """
-        for index, pk in enumerate(ordered_pks):
-            cls.objects.filter(pk=pk).update(sort_order=index)
+        # A single-row UPDATE statement run with executemany: the SQL text
+        # stays constant instead of growing a CASE/WHEN branch per row, and
+        # psycopg pipelines the parameter sets in one round trip
+        connection = connections[router.db_for_write(cls)]
+        quote = connection.ops.quote_name
+        sql = "UPDATE {} SET {} = %s WHERE {} = %s".format(
+            quote(cls._meta.db_table),
+            quote(cls._meta.get_field("sort_order").column),
+            quote(cls._meta.pk.column),
+        )
+        params = [(index, pk) for index, pk in enumerate(ordered_pks)]
+        if issubclass(cls, SoftDeleteModel):
+            # The raw UPDATE bypasses the manager's live-rows filter
+            sql += " AND {} = %s".format(quote(cls._meta.get_field("is_deleted").column))
+            params = [(index, pk, False) for index, pk in params]
+
+        with transaction.atomic(using=connection.alias, savepoint=False):
+            with connection.cursor() as cursor:
+                cursor.executemany(sql, params)
 
     @classmethod
     def get_next_sort_order(cls) -> int:
@@ -162,5 +243,8 @@ class SortableModel(TimeStampedModel):
         Example:
             new_category.sort_order = Category.get_next_sort_order()
         """
-        max_order = cls.objects.aggregate(max_order=models.Max("sort_order"))["max_order"]
+        # ORDER BY ... LIMIT 1 reads the end of the sort_order index
+        max_order = (
+            cls.objects.order_by("-sort_order").values_list("sort_order", flat=True).first()
+        )
         return (max_order or 0) + 1
@@ -0,0 +1,174 @@
+"""
+Soft-delete manager tests.
+
+Tests default/all-objects managers, related managers and bulk
+soft-delete operations on SoftDeleteQuerySet.
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.core.managers import soft_delete_prefetch
+from apps.orders.models import Coupon, Order
+
+User = get_user_model()
+
+
+def create_order(user=None, coupon=None, **kwargs):
+    """Create a minimal order for manager tests."""
+    defaults = {
+        'user': user,
+        'coupon': coupon,
+        'customer_name': 'Test Customer',
+        'customer_email': 'customer@example.com',
+        'customer_phone': '01712345678',
+        'shipping_address_line1': 'House 1, Road 1',
+        'shipping_city': 'Dhaka',
+        'shipping_area': 'Dhanmondi',
+        'subtotal': Decimal('100.00'),
+        'total': Decimal('100.00'),
+        'payment_method': 'cod',
+    }
+    defaults.update(kwargs)
+    return Order.objects.create(**defaults)
+
+
+class SoftDeleteRelatedManagerTest(TestCase):
+    """Test how soft-delete filtering applies across relations."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Create a user with a live and a deleted order."""
+        cls.user = User.objects.create_user(
+            email='buyer@example.com',
+            password='testpass123'
+        )
+        cls.coupon = Coupon.objects.create(
+            code='SAVE10',
+            name='Save 10',
+            discount_type='percentage',
+            discount_value=Decimal('10.00'),
+            valid_from=timezone.now() - timedelta(days=1),
+            valid_to=timezone.now() + timedelta(days=1),
+        )
+        cls.live_order = create_order(user=cls.user, coupon=cls.coupon)
+        cls.deleted_order = create_order(user=cls.user)
+        cls.deleted_order.delete()
+    
+    def test_reverse_relation_excludes_deleted(self):
+        """Test reverse managers use the filtering default manager."""
+        self.assertEqual(list(self.user.orders.all()), [self.live_order])
+    
+    def test_soft_delete_prefetch(self):
+        """Test the prefetch helper excludes deleted rows in one query."""
+        users = User.objects.filter(pk=self.user.pk).prefetch_related(
+            soft_delete_prefetch('orders', Order)
+        )
+        
+        with self.assertNumQueries(2):
+            orders = list(users[0].orders.all())
+        
+        self.assertEqual(orders, [self.live_order])
+    
+    def test_delete_with_explicit_timestamp(self):
+        """Test instance soft-delete uses a caller-supplied timestamp."""
+        now = timezone.now() - timedelta(minutes=5)
+        
+        self.live_order.delete(now=now)
+        
+        self.assertEqual(Order.all_objects.get(pk=self.live_order.pk).deleted_at, now)
+    
+    def test_default_manager_querysets_independent(self):
+        """Test querysets cloned from the cached template don't share state."""
+        first = Order.objects.all()
+        list(first)
+        
+        self.assertEqual(list(Order.objects.filter(user=None)), [])
+        self.assertEqual(Order.objects.db_manager('default').count(), 1)
+        self.assertIsNone(Order.objects.get_queryset()._result_cache)
+    
+    def test_all_objects_includes_deleted(self):
+        """Test all_objects sees soft-deleted rows."""
+        self.assertEqual(Order.all_objects.filter(user=self.user).count(), 2)
+    
+    def test_forward_relation_loads_deleted_target(self):
+        """Test forward FK access still resolves a soft-deleted object."""
+        self.coupon.delete()
+        order = Order.objects.get(pk=self.live_order.pk)
+        
+        self.assertEqual(order.coupon, self.coupon)
+        self.assertTrue(order.coupon.is_deleted)
+
+
+class SoftDeleteQuerySetTest(TestCase):
+    """Test bulk soft-delete and restore on querysets."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Create three orders, one already soft-deleted."""
+        cls.orders = [create_order() for _ in range(3)]
+        cls.orders[0].delete()
+    
+    def test_bulk_delete_single_update(self):
+        """Test queryset delete is one UPDATE touching only live rows."""
+        with self.assertNumQueries(1):
+            count, details = Order.all_objects.all().delete()
+        
+        self.assertEqual(count, 2)
+        self.assertEqual(details, {'orders.Order': 2})
+        self.assertFalse(Order.objects.exists())
+    
+    def test_bulk_delete_keeps_original_deleted_at(self):
+        """Test rows deleted earlier keep their deletion timestamp."""
+        first = Order.all_objects.get(pk=self.orders[0].pk)
+        
+        Order.all_objects.all().delete()
+        
+        first.refresh_from_db()
+        self.assertEqual(first.deleted_at, self.orders[0].deleted_at)
+    
+    def test_bulk_restore(self):
+        """Test queryset restore brings deleted rows back."""
+        Order.all_objects.all().delete()
+        
+        restored = Order.all_objects.all().restore()
+        
+        self.assertEqual(restored, 3)
+        self.assertEqual(Order.objects.count(), 3)
+    
+    def test_model_bulk_soft_delete(self):
+        """Test model-level bulk soft-delete stamps deleted_at in one query."""
+        with self.assertNumQueries(1):
+            count = Order.bulk_soft_delete(Order.all_objects.all())
+        
+        self.assertEqual(count, 2)
+        self.assertFalse(
+            Order.all_objects.filter(is_deleted=True, deleted_at__isnull=True).exists()
+        )
+    
+    def test_all_objects_ordered_by_created_at(self):
+        """Test the all-objects manager emits the indexed ORDER BY."""
+        sql = str(Order.all_objects.all().query)
+        
+        self.assertIn('ORDER BY "orders_order"."created_at" DESC', sql)
+    
+    def test_list_view_returns_dicts(self):
+        """Test list_view yields dicts of the requested live rows."""
+        rows = list(Order.objects.order_by('pk').list_view('pk', 'status'))
+        
+        self.assertEqual(
+            rows,
+            [{'pk': order.pk, 'status': 'pending'} for order in self.orders[1:]],
+        )
+    
+    def test_only_display_defers_other_fields(self):
+        """Test only_display loads display columns and skips missing names."""
+        order = Order.objects.all().only_display().get(pk=self.orders[1].pk)
+        deferred = order.get_deferred_fields()
+        
+        self.assertNotIn('status', deferred)
+        self.assertIn('customer_notes', deferred)
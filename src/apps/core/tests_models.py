@@ -0,0 +1,176 @@
+"""
+Abstract base model tests.
+
+Tests behaviour shared by models built on TimeStampedModel.
+"""
+
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.cms.models import ContactSubmission
+from apps.products.models import Category
+
+
+class TimeStampedModelTest(TestCase):
+    """Test automatic timestamp handling."""
+    
+    def setUp(self):
+        """Create a submission with an old updated_at."""
+        self.submission = ContactSubmission.objects.create(
+            name="Jane Doe",
+            email="jane@example.com",
+            subject="Question",
+            message="Hello"
+        )
+        self.old_timestamp = timezone.now() - timedelta(days=1)
+        ContactSubmission.objects.filter(pk=self.submission.pk).update(
+            updated_at=self.old_timestamp
+        )
+    
+    def test_partial_save_bumps_updated_at(self):
+        """Test save(update_fields=...) still writes updated_at."""
+        self.submission.is_read = True
+        self.submission.save(update_fields=["is_read"])
+        
+        self.submission.refresh_from_db()
+        self.assertGreater(self.submission.updated_at, self.old_timestamp)
+    
+    def test_partial_save_with_updated_at_listed(self):
+        """Test update_fields that already name updated_at are accepted."""
+        self.submission.is_read = True
+        self.submission.save(update_fields=("is_read", "updated_at"))
+        
+        self.submission.refresh_from_db()
+        self.assertTrue(self.submission.is_read)
+        self.assertGreater(self.submission.updated_at, self.old_timestamp)
+
+
+class SortableModelTest(TestCase):
+    """Test manual ordering helpers."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Create three categories in creation order."""
+        cls.categories = [
+            Category.objects.create(name=name, sort_order=index)
+            for index, name in enumerate(['Alpha', 'Beta', 'Gamma'])
+        ]
+    
+    def test_reorder_all_single_update(self):
+        """Test reorder_all assigns positions with one UPDATE."""
+        first, second, third = self.categories
+        
+        with self.assertNumQueries(1):
+            Category.reorder_all([third.pk, first.pk, second.pk])
+        
+        self.assertEqual(
+            list(Category.objects.order_by('sort_order').values_list('pk', flat=True)),
+            [third.pk, first.pk, second.pk],
+        )
+    
+    def test_reorder_all_skips_soft_deleted(self):
+        """Test reorder_all leaves soft-deleted rows' sort_order alone."""
+        first, second, third = self.categories
+        second.delete()
+        
+        Category.reorder_all([third.pk, first.pk, second.pk])
+        
+        self.assertEqual(Category.objects.get(pk=second.pk).sort_order, 1)
+        self.assertEqual(Category.objects.get(pk=third.pk).sort_order, 0)
+        self.assertEqual(Category.objects.get(pk=first.pk).sort_order, 1)
+    
+    def test_move_up_and_down_swap(self):
+        """Test moving swaps positions with the neighbour."""
+        first, second, third = self.categories
+        
+        self.assertTrue(second.move_up())
+        self.assertFalse(third.move_down())
+        
+        first.refresh_from_db()
+        self.assertEqual((first.sort_order, second.sort_order), (1, 0))
+        self.assertEqual(
+            list(Category.objects.order_by('sort_order').values_list('pk', flat=True)),
+            [second.pk, first.pk, third.pk],
+        )
+    
+    def test_move_between_uses_gap(self):
+        """Test a gap between neighbours is used without touching them."""
+        first, second, third = self.categories
+        Category.objects.filter(pk=second.pk).update(sort_order=10)
+        second.sort_order = 10
+        
+        third.move_between(first, second)
+        
+        self.assertEqual(third.sort_order, 5)
+        self.assertEqual(Category.objects.get(pk=second.pk).sort_order, 10)
+    
+    def test_move_between_shifts_without_gap(self):
+        """Test adjacent neighbours shift the tail with one UPDATE."""
+        first, second, third = self.categories
+        
+        with CaptureQueriesContext(connection) as ctx:
+            third.move_between(first, second)
+        
+        updates = [q['sql'] for q in ctx.captured_queries if q['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 2)
+        self.assertEqual(
+            list(Category.objects.order_by('sort_order').values_list('pk', flat=True)),
+            [first.pk, third.pk, second.pk],
+        )
+    
+    def test_get_next_sort_order(self):
+        """Test the next position follows the current maximum."""
+        self.assertEqual(Category.get_next_sort_order(), 3)
+
+
+class SEOModelTest(TestCase):
+    """Test automatic slug generation on save."""
+    
+    def test_slug_generated_on_create(self):
+        """Test a blank slug is derived from the name."""
+        category = Category.objects.create(name='Summer Sale')
+        
+        self.assertEqual(category.slug, 'summer-sale')
+    
+    def test_partial_save_skips_slug_generation(self):
+        """Test update_fields without slug runs only the UPDATE."""
+        category = Category.objects.create(name='Winter', slug='winter')
+        category.slug = ''
+        category.name = 'Winter Sale'
+        
+        with self.assertNumQueries(1):
+            category.save(update_fields=['name'])
+        
+        self.assertEqual(category.slug, '')
+    
+    def test_seo_data_cached_until_save(self):
+        """Test seo_data is built once and refreshed after save."""
+        category = Category.objects.create(name='Shoes', meta_title='Buy Shoes')
+        
+        self.assertIs(category.seo_data, category.seo_data)
+        
+        category.meta_title = 'Shoes Online'
+        category.save()
+        self.assertEqual(category.seo_data['title'], 'Shoes Online')
+    
+    def test_list_queryset_defers_description(self):
+        """Test list_queryset leaves meta_description unloaded."""
+        Category.objects.create(name='Bags', meta_description='All bags')
+        
+        category = Category.list_queryset().get(slug='bags')
+        
+        self.assertEqual(category.get_deferred_fields(), {'meta_description'})
+    
+    def test_bulk_prepare_slugs(self):
+        """Test blank slugs are filled before bulk_create."""
+        Category.objects.create(name='Hats')
+        categories = [Category(name='Hats'), Category(name='Caps', slug='my-caps')]
+        
+        Category.bulk_prepare_slugs(categories)
+        Category.objects.bulk_create(categories)
+        
+        self.assertEqual([c.slug for c in categories], ['hats-1', 'my-caps'])
@@ -4,12 +4,15 @@ Security tests.
 Tests rate limiting, throttling, validators, and security middleware.
 """
 
-from django.test import TestCase, Client, override_settings
+from django.http import HttpResponse
+from django.test import TestCase, Client, RequestFactory, override_settings
+from django.utils.functional import SimpleLazyObject
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
 
+from apps.core.middleware import SecurityLoggingMiddleware, SuspiciousRequestMiddleware
 from apps.core.validators import (
     BangladeshiPhoneValidator,
     validate_file_extension,
@@ -267,6 +270,83 @@ class SecurityMiddlewareTest(TestCase):
         self.assertEqual(response.status_code, 200)
 
 
+class SuspiciousRequestMiddlewareTest(TestCase):
+    """Test suspicious pattern matching directly on the middleware."""
+    
+    def setUp(self):
+        """Set up middleware with a pass-through response."""
+        self.factory = RequestFactory()
+        self.middleware = SuspiciousRequestMiddleware(lambda request: HttpResponse("ok"))
+    
+    def test_blocks_suspicious_path(self):
+        """Test traversal and script patterns in the path are blocked."""
+        for path in ['/static/../etc/passwd', '/search/<SCRIPT>x']:
+            with self.subTest(path=path):
+                response = self.middleware(self.factory.get(path))
+                self.assertEqual(response.status_code, 403)
+    
+    def test_blocks_suspicious_query_value(self):
+        """Test SQL patterns in query values are blocked case-insensitively."""
+        request = self.factory.get('/api/v1/products/', {'q': "1 UNION SELECT password"})
+        
+        response = self.middleware(request)
+        
+        self.assertEqual(response.status_code, 403)
+    
+    def test_allows_clean_request(self):
+        """Test ordinary paths and parameters pass through."""
+        request = self.factory.get('/api/v1/products/', {'q': 'blue shirt', 'page': '2'})
+        
+        response = self.middleware(request)
+        
+        self.assertEqual(response.status_code, 200)
+
+
+class SecurityLoggingMiddlewareTest(TestCase):
+    """Test security logging middleware behaviour."""
+    
+    def setUp(self):
+        """Set up middleware with a pass-through response."""
+        self.factory = RequestFactory()
+        self.middleware = SecurityLoggingMiddleware(lambda request: HttpResponse("ok"))
+    
+    def test_non_admin_response_does_not_resolve_user(self):
+        """Test request.user is never touched outside admin paths."""
+        request = self.factory.get('/api/v1/products/')
+        request.user = SimpleLazyObject(lambda: self.fail("request.user was resolved"))
+        
+        response = self.middleware(request)
+        
+        self.assertEqual(response.status_code, 200)
+    
+    def test_admin_response_without_user(self):
+        """Test admin responses short-circuited before auth don't crash."""
+        request = self.factory.get('/admin/')
+        
+        response = self.middleware(request)
+        
+        self.assertEqual(response.status_code, 200)
+    
+    def test_client_ip_cached_on_request(self):
+        """Test X-Forwarded-For is parsed once and reused."""
+        request = self.factory.get('/', HTTP_X_FORWARDED_FOR='203.0.113.7, 10.0.0.1')
+        
+        self.assertEqual(SecurityLoggingMiddleware.get_client_ip(request), '203.0.113.7')
+        
+        request.META['HTTP_X_FORWARDED_FOR'] = '198.51.100.1'
+        self.assertEqual(SecurityLoggingMiddleware.get_client_ip(request), '203.0.113.7')
+    
+    def test_failed_auth_logged(self):
+        """Test failed login attempts are logged as warnings."""
+        middleware = SecurityLoggingMiddleware(lambda request: HttpResponse(status=401))
+        request = self.factory.post('/api/v1/auth/login/')
+        
+        with self.assertLogs('apps.core.middleware', level='WARNING') as logs:
+            middleware(request)
+        
+        self.assertIn('Failed auth', logs.output[0])
+
+
 class SecurityHeadersTest(TestCase):
     """Test security headers in responses."""
     
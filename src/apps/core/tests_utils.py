@@ -0,0 +1,152 @@
+"""
+Core utility tests.
+
+Tests slug, SKU, order number and price helpers in apps.core.utils.
+"""
+
+from decimal import Decimal
+
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from apps.cms.models import Page
+from apps.core.tests_managers import create_order
+from apps.core.utils import (
+    _suffix_lookup,
+    format_price,
+    generate_order_number,
+    generate_sku,
+    generate_skus,
+    generate_unique_slug,
+    generate_unique_slugs,
+)
+from apps.orders.models import OrderNumberSequence
+
+
+class GenerateUniqueSlugTest(TestCase):
+    """Test unique slug generation against existing rows."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Create pages occupying the base slug and its first suffix."""
+        cls.about = Page.objects.create(title="About", slug="about")
+        Page.objects.create(title="About", slug="about-1")
+        Page.objects.create(title="About Team", slug="about-team")
+    
+    def test_free_slug_returned_unchanged(self):
+        """Test an unused slug is returned as-is."""
+        self.assertEqual(generate_unique_slug(Page, "Contact"), "contact")
+    
+    def test_lowest_free_suffix_in_one_query(self):
+        """Test collisions are resolved with a single query."""
+        with self.assertNumQueries(1):
+            slug = generate_unique_slug(Page, "About")
+        
+        self.assertEqual(slug, "about-2")
+    
+    def test_instance_excluded(self):
+        """Test the instance being updated keeps its own slug."""
+        self.assertEqual(generate_unique_slug(Page, "About", instance=self.about), "about")
+    
+    def test_unrelated_prefix_slugs_not_fetched(self):
+        """Test only the base and its -N variants are loaded as candidates."""
+        Page.objects.create(title="Aboutus", slug="aboutus")
+        
+        candidates = Page.objects.filter(
+            _suffix_lookup("slug", ["about"], max_length=200)
+        ).values_list("slug", flat=True)
+        
+        self.assertEqual(set(candidates), {"about", "about-1"})
+    
+    def test_suffix_respects_max_length(self):
+        """Test suffixed slugs are truncated to fit max_length."""
+        Page.objects.create(title="x", slug="abcdefghij")
+        
+        self.assertEqual(generate_unique_slug(Page, "abcdefghij", max_length=10), "abcdefgh-1")
+
+
+class GenerateUniqueSlugsTest(TestCase):
+    """Test batch slug generation."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Create pages occupying a base slug and its first suffix."""
+        Page.objects.create(title="About", slug="about")
+        Page.objects.create(title="About", slug="about-1")
+    
+    def test_unique_against_table_and_batch(self):
+        """Test duplicates in the batch and in the table get free suffixes."""
+        with self.assertNumQueries(2):
+            slugs = generate_unique_slugs(Page, ["About", "Contact", "Contact", "About"])
+        
+        self.assertEqual(slugs, ["about-2", "contact", "contact-1", "about-3"])
+    
+    def test_no_collisions_single_query(self):
+        """Test a batch of new slugs needs one query."""
+        with self.assertNumQueries(1):
+            slugs = generate_unique_slugs(Page, ["Faq", "Terms"])
+        
+        self.assertEqual(slugs, ["faq", "terms"])
+
+
+class GenerateSkuTest(TestCase):
+    """Test SKU formatting and random suffixes."""
+    
+    def test_sku_format(self):
+        """Test attributes are cleaned and an 8-char hex suffix appended."""
+        sku = generate_sku("tee", {"size": "M", "color": "Dark Red"})
+        prefix, size, color, suffix = sku.split("-")
+        
+        self.assertEqual((prefix, size, color), ("TEE", "M", "DARKRED"))
+        self.assertRegex(suffix, r"^[0-9A-F]{8}$")
+    
+    def test_batch_matches_single_format(self):
+        """Test batch SKUs share the format and get distinct suffixes."""
+        skus = generate_skus("tee", [{"size": "M"}, {"size": "L"}])
+        
+        self.assertEqual([sku.rsplit("-", 1)[0] for sku in skus], ["TEE-M", "TEE-L"])
+        for sku in skus:
+            self.assertRegex(sku.rsplit("-", 1)[1], r"^[0-9A-F]{8}$")
+    
+    def test_without_suffix(self):
+        """Test the random suffix can be disabled."""
+        self.assertEqual(generate_sku("PHONE", {"storage": "128GB"}, random_suffix=False), "PHONE-128GB")
+
+
+class GenerateOrderNumberTest(TestCase):
+    """Test sequential order number generation."""
+    
+    def setUp(self):
+        """Compute this year's order number prefix."""
+        self.prefix = f"ORD-{timezone.localdate().year}-"
+    
+    def test_numbers_are_sequential(self):
+        """Test each call reserves the next number."""
+        order = create_order()
+        
+        self.assertEqual(order.order_number, f"{self.prefix}00001")
+        self.assertEqual(generate_order_number(), f"{self.prefix}00002")
+    
+    def test_counter_seeded_from_existing_orders(self):
+        """Test a new counter continues after existing order numbers."""
+        create_order(order_number=f"{self.prefix}00041")
+        
+        self.assertFalse(OrderNumberSequence.objects.exists())
+        self.assertEqual(generate_order_number(), f"{self.prefix}00042")
+
+
+class FormatPriceTest(SimpleTestCase):
+    """Test price display formatting."""
+    
+    def test_formats_supported_types(self):
+        """Test Decimal, int, float and string amounts format alike."""
+        cases = [
+            (Decimal('1500'), '৳1,500.00'),
+            (1500, '৳1,500.00'),
+            (2.675, '৳2.68'),
+            ('99.5', '৳99.50'),
+            (None, '৳0.00'),
+        ]
+        for amount, expected in cases:
+            with self.subTest(amount=amount):
+                self.assertEqual(format_price(amount), expected)
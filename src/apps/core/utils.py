@@ -16,12 +16,15 @@ Usage:
     # Returns: "TEE-M-RED"
 """
 
-import random
-import string
+import re
+import secrets
 import uuid
+from collections.abc import Iterable
+from decimal import Decimal
 from typing import TYPE_CHECKING, Any
 
 from django.db import models
+from django.utils import timezone
 from django.utils.text import slugify
 
 if TYPE_CHECKING:
@@ -39,7 +42,8 @@ def generate_unique_slug(
     Generate a unique slug for a model instance.
 
     Creates a slug from the given value, then checks if it exists in the
-    database. If it does, appends a number suffix until unique.
+    database. If it does, appends the lowest number suffix that is free.
+    Existing slugs are fetched in a single query and compared in memory.
 
     Args:
         model_class: The Django model class to check uniqueness against.
@@ -58,38 +62,132 @@ def generate_unique_slug(
         # For updating (exclude self from uniqueness check)
         slug = generate_unique_slug(Product, "New Name", instance=product)
     """
-    # Create base slug
+    base_slug = _base_slug(value, max_length)
+
+    # Build queryset for checking existence
+    queryset = model_class.objects.all()
+
+    # If updating existing instance, exclude it from uniqueness check
+    if instance and instance.pk:
+        queryset = queryset.exclude(pk=instance.pk)
+
+    # Fetch every slug a candidate could collide with in one query
+    taken = set(
+        queryset.filter(_suffix_lookup(slug_field, [base_slug], max_length)).values_list(
+            slug_field, flat=True
+        )
+    )
+
+    return _first_free_slug(base_slug, taken, max_length)
+
+
+def generate_unique_slugs(
+    model_class: type["Model"],
+    values: list[str],
+    slug_field: str = "slug",
+    max_length: int = 255,
+) -> list[str]:
+    """
+    Generate unique slugs for a batch of new records.
+
+    Batch counterpart of generate_unique_slug for bulk_create/import
+    paths. Slugs are unique against the database and within the batch,
+    using at most two queries regardless of batch size.
+
+    Args:
+        model_class: The Django model class to check uniqueness against.
+        values: Strings to slugify, one per record.
+        slug_field: The name of the slug field in the model.
+        max_length: Maximum length of the generated slugs.
+
+    Returns:
+        List of unique slugs in the same order as values.
+
+    Example:
+        slugs = generate_unique_slugs(Product, ["Shirt", "Shirt", "Cap"])
+        # Returns: ["shirt", "shirt-1", "cap"] on an empty table
+    """
+    base_slugs = [_base_slug(value, max_length) for value in values]
+    queryset = model_class.objects.all()
+
+    # Exact matches first; only colliding bases need their suffixes fetched
+    taken = set(
+        queryset.filter(**{f"{slug_field}__in": set(base_slugs)}).values_list(
+            slug_field, flat=True
+        )
+    )
+    seen = set()
+    colliding = set()
+    for base_slug in base_slugs:
+        if base_slug in taken or base_slug in seen:
+            colliding.add(base_slug)
+        seen.add(base_slug)
+
+    if colliding:
+        taken.update(
+            queryset.filter(_suffix_lookup(slug_field, colliding, max_length)).values_list(
+                slug_field, flat=True
+            )
+        )
+
+    slugs = []
+    for base_slug in base_slugs:
+        slug = _first_free_slug(base_slug, taken, max_length)
+        taken.add(slug)
+        slugs.append(slug)
+
+    return slugs
+
+
+def _base_slug(value: str, max_length: int) -> str:
+    """Slugify a value, falling back to a random slug if nothing is left."""
     base_slug = slugify(value)[:max_length]
 
     if not base_slug:
         # If slugify returns empty (e.g., non-ASCII characters only)
         base_slug = f"item-{uuid.uuid4().hex[:8]}"
 
-    slug = base_slug
-    counter = 1
+    return base_slug
 
-    # Build queryset for checking existence
-    queryset = model_class.objects.all()
 
-    # If updating existing instance, exclude it from uniqueness check
-    if instance and instance.pk:
-        queryset = queryset.exclude(pk=instance.pk)
+def _suffix_lookup(slug_field: str, base_slugs: Iterable[str], max_length: int) -> models.Q:
+    """
+    Build a filter matching every slug that could collide with the bases.
 
-    # Keep trying until we find a unique slug
-    while queryset.filter(**{slug_field: slug}).exists():
-        # Calculate available space for counter suffix
+    Matches each base itself and its -N variants only, so unrelated slugs
+    sharing a prefix ("apple" for base "a") are not fetched. Suffixed
+    candidates truncate the base to fit max_length, so each suffix width
+    tried gets its own anchored pattern when the truncation differs.
+    """
+    lookup = models.Q()
+    for base_slug in base_slugs:
+        lookup |= models.Q(**{slug_field: base_slug})
+        prefixes = {base_slug[: max_length - len(f"-{n}")] for n in (1, 10, 100)}
+        for prefix in prefixes:
+            lookup |= models.Q(
+                **{f"{slug_field}__regex": rf"^{re.escape(prefix)}-[0-9]+$"}
+            )
+    return lookup
+
+
+def _first_free_slug(base_slug: str, taken: set[str], max_length: int) -> str:
+    """Return base_slug or its lowest free -N variant, checked in memory."""
+    if base_slug not in taken:
+        return base_slug
+
+    for counter in range(1, 1000):
         suffix = f"-{counter}"
         max_base_length = max_length - len(suffix)
         slug = f"{base_slug[:max_base_length]}{suffix}"
-        counter += 1
+        if slug not in taken:
+            return slug
 
-        # Safety limit to prevent infinite loops
-        if counter > 1000:
-            # Fallback to UUID-based slug
-            slug = f"{base_slug[:max_length - 9]}-{uuid.uuid4().hex[:8]}"
-            break
+    # Safety limit reached: fallback to UUID-based slug
+    return f"{base_slug[:max_length - 9]}-{uuid.uuid4().hex[:8]}"
 
-    return slug
+
+# Characters removed from attribute values when building SKUs
+_SKU_STRIP = str.maketrans("", "", " -")
 
 
 def generate_sku(
@@ -101,7 +199,7 @@ def generate_sku(
     Generate a SKU (Stock Keeping Unit) for a product variant.
 
     Creates a structured SKU from a prefix and attribute values.
-    Format: PREFIX-ATTR1-ATTR2-RANDOM (e.g., "TEE-M-RED-A1B2")
+    Format: PREFIX-ATTR1-ATTR2-RANDOM (e.g., "TEE-M-RED-3F9A1C0B")
 
     Args:
         prefix: Product prefix/code (e.g., "TEE", "JEAN", "PHONE").
@@ -113,50 +211,62 @@ def generate_sku(
 
     Example:
         sku = generate_sku("TEE", {"size": "M", "color": "Red"})
-        # Returns: "TEE-M-RED-A1B2"
+        # Returns: "TEE-M-RED-3F9A1C0B"
 
         sku = generate_sku("PHONE", {"storage": "128GB"}, random_suffix=False)
         # Returns: "PHONE-128GB"
     """
-    parts = [prefix.upper()]
-
-    if attributes:
-        for value in attributes.values():
-            # Clean and format attribute value
-            cleaned = str(value).upper().replace(" ", "").replace("-", "")[:10]
-            if cleaned:
-                parts.append(cleaned)
+    parts = _sku_parts(prefix, attributes)
 
     if random_suffix:
-        # Add 4 random alphanumeric characters
-        suffix = "".join(random.choices(string.ascii_uppercase + string.digits, k=4))
-        parts.append(suffix)
+        # Add 8 random hex characters (32 bits) in one call; 4 alphanumerics
+        # gave birthday collisions after roughly a thousand SKUs
+        parts.append(secrets.token_hex(4).upper())
 
     return "-".join(parts)
 
 
-def generate_order_number(prefix: str = "ORD") -> str:
+def generate_skus(prefix: str, attribute_sets: list[dict[str, str]]) -> list[str]:
     """
-    Generate a unique order number.
+    Generate SKUs with random suffixes for many variants at once.
 
-    Format: PREFIX-YYYY-XXXXXXXX (e.g., "ORD-2026-A1B2C3D4")
+    Same format as generate_sku(), but all random suffixes are drawn from
+    a single secrets call instead of one per SKU.
 
     Args:
-        prefix: Order number prefix. Defaults to "ORD".
+        prefix: Product prefix/code (e.g., "TEE").
+        attribute_sets: One attribute dictionary per variant.
 
     Returns:
-        Generated order number string.
+        List of SKUs in the same order as attribute_sets.
 
     Example:
-        order_number = generate_order_number()
-        # Returns: "ORD-2026-A1B2C3D4"
+        skus = generate_skus("TEE", [{"size": "M"}, {"size": "L"}])
+        # Returns: ["TEE-M-3F9A1C0B", "TEE-L-77D20E41"]
     """
-    from django.utils import timezone
+    random_hex = secrets.token_hex(4 * len(attribute_sets)).upper()
 
-    year = timezone.now().year
-    random_part = "".join(random.choices(string.ascii_uppercase + string.digits, k=8))
+    skus = []
+    for index, attributes in enumerate(attribute_sets):
+        parts = _sku_parts(prefix, attributes)
+        parts.append(random_hex[index * 8 : index * 8 + 8])
+        skus.append("-".join(parts))
 
-    return f"{prefix}-{year}-{random_part}"
+    return skus
+
+
+def _sku_parts(prefix: str, attributes: dict[str, str] | None) -> list[str]:
+    """Return the prefix and cleaned attribute values of a SKU."""
+    parts = [prefix.upper()]
+
+    if attributes:
+        for value in attributes.values():
+            # Clean and format attribute value
+            cleaned = str(value).translate(_SKU_STRIP).upper()[:10]
+            if cleaned:
+                parts.append(cleaned)
+
+    return parts
 
 
 def generate_public_id() -> str:
@@ -242,12 +352,13 @@ def format_price(amount: Any, currency_symbol: str = "৳") -> str:
         format_price(1500)
         # Returns: "৳1,500.00"
     """
-    from decimal import Decimal
-
     if amount is None:
         return f"{currency_symbol}0.00"
 
-    amount = Decimal(str(amount))
+    # Decimal and int format exactly as-is; floats and strings go through
+    # Decimal(str()) so e.g. 2.675 rounds as written rather than as stored
+    if not isinstance(amount, (Decimal, int)):
+        amount = Decimal(str(amount))
     formatted = f"{amount:,.2f}"
 
     return f"{currency_symbol}{formatted}"
@@ -260,6 +371,9 @@ def generate_order_number() -> str:
     Format: ORD-YYYY-NNNNN
     Example: ORD-2026-00001
 
+    Numbers come from a per-year counter row (OrderNumberSequence), so
+    concurrent orders cannot be given the same number.
+
     Returns:
         Unique order number string
 
@@ -267,27 +381,12 @@ def generate_order_number() -> str:
         order_number = generate_order_number()
         # Returns: "ORD-2026-00001"
     """
-    from datetime import datetime
+    # Imported here: apps.orders.models imports apps.core.models, which
+    # imports this module
+    from apps.orders.models import OrderNumberSequence
 
-    from apps.orders.models import Order
-
-    year = datetime.now().year
-    prefix = f"ORD-{year}-"
-
-    # Get last order number for this year
-    last_order = (
-        Order.all_objects.filter(order_number__startswith=prefix)
-        .order_by("-order_number")
-        .first()
-    )
-
-    if last_order:
-        # Extract number and increment
-        last_number = int(last_order.order_number.split("-")[-1])
-        next_number = last_number + 1
-    else:
-        next_number = 1
+    year = timezone.localdate().year
+    next_number = OrderNumberSequence.next_number(year)
 
     # Format with 5 digits
-    return f"{prefix}{next_number:05d}"
-
+    return f"ORD-{year}-{next_number:05d}"
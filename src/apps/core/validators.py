@@ -5,6 +5,7 @@ This module provides validators and sanitizers to prevent
 XSS, SQL injection, and other security vulnerabilities.
 """
 
+import html
 import re
 from typing import List, Optional
 from django.core.exceptions import ValidationError
@@ -21,7 +22,8 @@ class BangladeshiPhoneValidator(RegexValidator):
     - 8801712345678 (without +)
     """
     
-    regex = r'^(\+?880|0)?1[3-9]\d{8}$'
+    # Compiled once at import and shared by every instance
+    regex = re.compile(r'^(\+?880|0)?1[3-9]\d{8}$')
     message = 'Enter a valid Bangladeshi phone number (e.g., 01712345678)'
     code = 'invalid_phone'
 
@@ -82,20 +84,21 @@ def validate_image_file(value):
 
 def sanitize_html(text: str) -> str:
     """
-    Remove HTML tags from text to prevent XSS.
+    Neutralise HTML in text to prevent XSS.
     
     Args:
         text: Input text that may contain HTML
         
     Returns:
-        str: Sanitized text with HTML removed
+        str: Text with HTML special characters escaped
     """
-    import html
-    # Escape HTML entities
-    text = html.escape(text)
-    # Remove any remaining tags
-    text = re.sub(r'<[^>]*>', '', text)
-    return text
+    # Escape HTML entities. This leaves no '<' behind, so no tag-stripping
+    # regex pass is needed afterwards.
+    return html.escape(text)
+
+
+# Matches any non-digit; compiled once for phone sanitization
+_NON_DIGIT_RE = re.compile(r'\D')
 
 
 def sanitize_phone_number(phone: str) -> str:
@@ -114,7 +117,7 @@ def sanitize_phone_number(phone: str) -> str:
         01712345678 -> 01712345678
     """
     # Remove all non-digit characters
-    phone = re.sub(r'\D', '', phone)
+    phone = _NON_DIGIT_RE.sub('', phone)
     
     # Remove country code if present
     if phone.startswith('880'):
@@ -214,6 +217,6 @@ def validate_json_structure(data: dict, required_keys: List[str]) -> bool:
     return True
 
 
-# Common validators
+# Common validators (stateless; reuse these instead of instantiating per call)
 phone_validator = BangladeshiPhoneValidator()
 email_validator = EmailValidator()
@@ -2,7 +2,8 @@
 
 from django.contrib import admin
 
-# Dashboard app doesn't have models to register.
+# Dashboard app doesn't register models: DailyRevenueRollup is derived
+# data maintained by the refresh_revenue_rollup command.
 # Dashboard functionality is provided through:
 # 1. Dashboard callback in views.py (integrated with Unfold)
 # 2. URL endpoints for AJAX data
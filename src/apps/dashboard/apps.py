@@ -14,3 +14,7 @@ class DashboardConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.dashboard'
     verbose_name = 'Dashboard'
+    
+    def ready(self) -> None:
+        """Import signals so cache invalidation is registered."""
+        import apps.dashboard.signals  # noqa: F401
@@ -0,0 +1,76 @@
+# Generated by Django 5.1.15 on 2026-10-17 12:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyRevenueRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        db_index=True,
+                        help_text="Timestamp when this record was created.",
+                        verbose_name="Created At",
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True,
+                        help_text="Timestamp when this record was last modified.",
+                        verbose_name="Updated At",
+                    ),
+                ),
+                (
+                    "date",
+                    models.DateField(
+                        help_text="Calendar day the figures cover.",
+                        unique=True,
+                        verbose_name="Date",
+                    ),
+                ),
+                (
+                    "revenue",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        help_text="Total of paid orders created this day.",
+                        max_digits=14,
+                        verbose_name="Revenue",
+                    ),
+                ),
+                (
+                    "order_count",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Number of paid orders created this day.",
+                        verbose_name="Order Count",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Daily Revenue Rollup",
+                "verbose_name_plural": "Daily Revenue Rollups",
+                "db_table": "dashboard_daily_revenue_rollup",
+                "ordering": ["-date"],
+            },
+        ),
+    ]
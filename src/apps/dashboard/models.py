@@ -1,12 +1,57 @@
 """
 Dashboard models.
 
-This module defines models for dashboard configuration.
-Currently minimal as dashboard uses data from existing models.
+This module defines models for dashboard configuration and reporting.
+Most dashboard figures are computed from existing models (Order,
+Product, User, etc.); DailyRevenueRollup stores pre-aggregated daily
+revenue so charts don't rescan orders on every load.
 """
 
 from django.db import models
 
-# Dashboard uses data from existing models (Order, Product, User, etc.)
-# No custom models needed for Phase 18.
-# Future phases may add DashboardWidget or DashboardPreference models.
+from apps.core.models import TimeStampedModel
+
+
+class DailyRevenueRollup(TimeStampedModel):
+    """
+    Paid revenue and order count for one calendar day.
+
+    Rows are written by DashboardService.refresh_revenue_rollup(), run on
+    a schedule by the refresh_revenue_rollup management command. Only
+    closed days are rolled up; today's figure is always computed live.
+
+    Attributes:
+        date: Calendar day the figures cover (unique).
+        revenue: Total of paid orders created that day.
+        order_count: Number of paid orders created that day.
+    """
+
+    date = models.DateField(
+        verbose_name="Date",
+        unique=True,
+        help_text="Calendar day the figures cover.",
+    )
+
+    revenue = models.DecimalField(
+        verbose_name="Revenue",
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+        help_text="Total of paid orders created this day.",
+    )
+
+    order_count = models.PositiveIntegerField(
+        verbose_name="Order Count",
+        default=0,
+        help_text="Number of paid orders created this day.",
+    )
+
+    class Meta:
+        db_table = "dashboard_daily_revenue_rollup"
+        verbose_name = "Daily Revenue Rollup"
+        verbose_name_plural = "Daily Revenue Rollups"
+        ordering = ["-date"]
+
+    def __str__(self) -> str:
+        """Return the day and its revenue."""
+        return f"{self.date}: {self.revenue}"
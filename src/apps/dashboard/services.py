@@ -5,20 +5,39 @@ This module provides methods to calculate and retrieve dashboard metrics
 including orders, revenue, customer statistics, and inventory alerts.
 """
 
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta
 from decimal import Decimal
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any
 
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
 from django.db.models import Sum, Count, Q, F
+from django.db.models.functions import TruncDate
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 
-from apps.orders.models import Order, Cart, CartItem
+from apps.orders.models import REVENUE_STATUSES, Order, CartItem
 from apps.products.models import ProductVariant
 from apps.engagement.models import ProductReview
 
+from .models import DailyRevenueRollup
+
 User = get_user_model()
 
+# Seconds a dashboard figure may be served from cache
+CACHE_TIMEOUT = 30
+
+# Counter embedded in every dashboard cache key; bumping it invalidates all
+CACHE_GENERATION_KEY = 'dashboard:generation'
+
+# Seconds the last computed value is kept to serve during a recompute
+STALE_TIMEOUT = 60 * 60 * 24
+
+# Seconds a recompute lock is held at most
+RECOMPUTE_LOCK_TIMEOUT = 10
+
 
 class DashboardService:
     """
@@ -26,8 +45,131 @@ class DashboardService:
     
     Provides methods to calculate key business metrics for the admin dashboard
     including sales, revenue, customer stats, inventory alerts, and trends.
+    
+    The methods always query the database; views go through cached() so
+    the admin page render and the AJAX refresh that follows it share
+    one computation. Saving the models the figures are built from calls
+    invalidate_cache() (see apps.dashboard.signals).
     """
     
+    @staticmethod
+    def cache_get_or_set(name: str, compute: Callable[[], Any], timeout: int = CACHE_TIMEOUT) -> Any:
+        """
+        Get a dashboard value from cache, computing it on a miss.
+        
+        Only one worker recomputes an expired value at a time: it takes a
+        short lock with cache.add(), while concurrent requests get the last
+        computed value (kept for STALE_TIMEOUT) instead of running the same
+        aggregation. Without a previous value they compute it themselves.
+        
+        Args:
+            name: Cache key suffix identifying the value
+            compute: Callable returning the value
+            timeout: Seconds to keep the value
+            
+        Returns:
+            The cached or freshly computed value
+        """
+        generation = cache.get_or_set(CACHE_GENERATION_KEY, 1, None)
+        key = f'dashboard:{generation}:{name}'
+        value = cache.get(key)
+        if value is not None:
+            return value
+        
+        # Stale copies and locks outlive generations on purpose
+        stale_key = f'dashboard:stale:{name}'
+        lock_key = f'dashboard:lock:{name}'
+        locked = cache.add(lock_key, 1, RECOMPUTE_LOCK_TIMEOUT)
+        if not locked:
+            value = cache.get(stale_key)
+            if value is not None:
+                return value
+        
+        try:
+            value = compute()
+            cache.set(key, value, timeout)
+            cache.set(stale_key, value, STALE_TIMEOUT)
+        finally:
+            if locked:
+                cache.delete(lock_key)
+        return value
+    
+    @staticmethod
+    def invalidate_cache() -> None:
+        """
+        Invalidate every cached dashboard value.
+        
+        Moves all keys to a new generation instead of deleting them; the
+        old entries simply expire.
+        """
+        try:
+            cache.incr(CACHE_GENERATION_KEY)
+        except ValueError:
+            # No generation yet, so nothing has been cached
+            pass
+    
+    @staticmethod
+    def cached(method_name: str, **kwargs: Any) -> Any:
+        """
+        Get a service method's result through a short-lived cache.
+        
+        Args:
+            method_name: Name of a DashboardService method
+            **kwargs: Keyword arguments for the method; part of the cache key
+            
+        Returns:
+            The method's result, at most CACHE_TIMEOUT seconds old
+        """
+        name = method_name + ''.join(
+            f':{key}={value}' for key, value in sorted(kwargs.items())
+        )
+        method = getattr(DashboardService, method_name)
+        return DashboardService.cache_get_or_set(name, lambda: method(**kwargs))
+    
+    @staticmethod
+    def cached_many(**calls: tuple) -> Dict[str, Any]:
+        """
+        Get several service results through cached() at once.
+        
+        With settings.DASHBOARD_QUERY_WORKERS above 1 the calls run on a
+        thread pool, so cache misses cost about the slowest aggregation
+        instead of the sum of all of them. Each worker thread opens its
+        own database connection and closes it when its call is done.
+        
+        Args:
+            **calls: Result names mapped to (method_name, kwargs) tuples
+            
+        Returns:
+            dict: Result names mapped to the method results
+            
+        Example:
+            stats = DashboardService.cached_many(
+                today=('get_today_stats', {}),
+                revenue_chart=('get_revenue_chart', {'days': 7}),
+            )
+        """
+        workers = min(getattr(settings, 'DASHBOARD_QUERY_WORKERS', 1), len(calls))
+        if workers <= 1:
+            return {
+                name: DashboardService.cached(method_name, **kwargs)
+                for name, (method_name, kwargs) in calls.items()
+            }
+        
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                name: pool.submit(DashboardService._cached_in_thread, method_name, kwargs)
+                for name, (method_name, kwargs) in calls.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
+    
+    @staticmethod
+    def _cached_in_thread(method_name: str, kwargs: Dict[str, Any]) -> Any:
+        """Run cached() in a worker thread, closing its connection after."""
+        try:
+            return DashboardService.cached(method_name, **kwargs)
+        finally:
+            connection.close()
+    
     @staticmethod
     def get_today_stats() -> Dict[str, Any]:
         """
@@ -46,51 +188,52 @@ class DashboardService:
         today = timezone.now().date()
         yesterday = today - timedelta(days=1)
         
-        # Today's orders
-        today_orders = Order.objects.filter(
-            created_at__date=today,
-            is_deleted=False
-        ).count()
-        
-        yesterday_orders = Order.objects.filter(
-            created_at__date=yesterday,
+        # Day boundaries as datetimes, so the filters are plain ranges
+        # the created_at/date_joined indexes can serve
+        yesterday_start = DashboardService._day_start(yesterday)
+        today_start = DashboardService._day_start(today)
+        tomorrow_start = DashboardService._day_start(today + timedelta(days=1))
+        
+        # Orders and revenue for both days in one conditional aggregate
+        today_q = Q(created_at__gte=today_start)
+        yesterday_q = Q(created_at__lt=today_start)
+        paid_q = Q(status__in=REVENUE_STATUSES)
+        order_stats = Order.objects.filter(
+            created_at__gte=yesterday_start,
+            created_at__lt=tomorrow_start,
             is_deleted=False
-        ).count()
+        ).aggregate(
+            today_orders=Count('id', filter=today_q),
+            yesterday_orders=Count('id', filter=yesterday_q),
+            today_revenue=Sum('total', filter=today_q & paid_q),
+            yesterday_revenue=Sum('total', filter=yesterday_q & paid_q),
+        )
         
+        today_orders = order_stats['today_orders']
+        yesterday_orders = order_stats['yesterday_orders']
         orders_change = DashboardService._calculate_percentage_change(
             yesterday_orders, today_orders
         )
         
-        # Today's revenue
-        today_revenue = Order.objects.filter(
-            created_at__date=today,
-            is_deleted=False,
-            status__in=['confirmed', 'processing', 'shipped', 'delivered']
-        ).aggregate(total=Sum('total'))['total'] or Decimal('0.00')
-        
-        yesterday_revenue = Order.objects.filter(
-            created_at__date=yesterday,
-            is_deleted=False,
-            status__in=['confirmed', 'processing', 'shipped', 'delivered']
-        ).aggregate(total=Sum('total'))['total'] or Decimal('0.00')
-        
+        today_revenue = order_stats['today_revenue'] or Decimal('0.00')
+        yesterday_revenue = order_stats['yesterday_revenue'] or Decimal('0.00')
         revenue_change = DashboardService._calculate_percentage_change(
             float(yesterday_revenue), float(today_revenue)
         )
         
-        # New customers today
-        today_customers = User.objects.filter(
-            date_joined__date=today,
-            is_staff=False
-        ).count()
-        
-        yesterday_customers = User.objects.filter(
-            date_joined__date=yesterday,
+        # New customers for both days in one query
+        customer_stats = User.objects.filter(
+            date_joined__gte=yesterday_start,
+            date_joined__lt=tomorrow_start,
             is_staff=False
-        ).count()
+        ).aggregate(
+            today_customers=Count('id', filter=Q(date_joined__gte=today_start)),
+            yesterday_customers=Count('id', filter=Q(date_joined__lt=today_start)),
+        )
         
+        today_customers = customer_stats['today_customers']
         customers_change = DashboardService._calculate_percentage_change(
-            yesterday_customers, today_customers
+            customer_stats['yesterday_customers'], today_customers
         )
         
         # Pending reviews
@@ -125,26 +268,18 @@ class DashboardService:
         """
         cutoff_time = timezone.now() - timedelta(hours=24)
         
-        # Get carts with items, no order, older than 24h
-        abandoned_carts = Cart.objects.filter(
-            created_at__lt=cutoff_time
-        ).annotate(
-            items_count=Count('items')
-        ).filter(
-            items_count__gt=0
+        # Aggregate over the items of old carts in one query; carts
+        # without items have no rows here, so they are never counted
+        totals = CartItem.objects.filter(
+            cart__created_at__lt=cutoff_time
+        ).aggregate(
+            count=Count('cart', distinct=True),
+            potential_revenue=Sum(F('quantity') * F('unit_price')),
         )
         
-        # Calculate potential revenue
-        potential_revenue = Decimal('0.00')
-        for cart in abandoned_carts:
-            cart_total = cart.items.aggregate(
-                total=Sum(F('quantity') * F('unit_price'))
-            )['total'] or Decimal('0.00')
-            potential_revenue += cart_total
-        
         return {
-            'count': abandoned_carts.count(),
-            'potential_revenue': potential_revenue,
+            'count': totals['count'],
+            'potential_revenue': totals['potential_revenue'] or Decimal('0.00'),
         }
     
     @staticmethod
@@ -152,6 +287,9 @@ class DashboardService:
         """
         Get daily revenue data for chart.
         
+        Closed days are read from DailyRevenueRollup; today, and any day
+        the rollup hasn't covered yet, are aggregated from orders.
+        
         Args:
             days: Number of days to include (default 7)
             
@@ -163,18 +301,31 @@ class DashboardService:
         end_date = timezone.now().date()
         start_date = end_date - timedelta(days=days - 1)
         
+        revenue_by_day = dict(
+            DailyRevenueRollup.objects.filter(
+                date__gte=start_date,
+                date__lt=end_date
+            ).order_by().values_list('date', 'revenue')
+        )
+        
+        # Aggregate from the first day missing from the rollup onwards;
+        # today is never rolled up
+        live_start = next(
+            start_date + timedelta(days=i)
+            for i in range(days)
+            if start_date + timedelta(days=i) not in revenue_by_day
+        )
+        for day, (revenue, _) in DashboardService._daily_revenue(
+            live_start, end_date
+        ).items():
+            revenue_by_day[day] = revenue
+        
         labels = []
         data = []
         
         for i in range(days):
             date = start_date + timedelta(days=i)
-            
-            # Get revenue for this date
-            revenue = Order.objects.filter(
-                created_at__date=date,
-                is_deleted=False,
-                status__in=['confirmed', 'processing', 'shipped', 'delivered']
-            ).aggregate(total=Sum('total'))['total'] or Decimal('0.00')
+            revenue = revenue_by_day.get(date, Decimal('0.00'))
             
             labels.append(date.strftime('%a'))  # Mon, Tue, etc.
             data.append(float(revenue))
@@ -184,6 +335,89 @@ class DashboardService:
             'data': data,
         }
     
+    @staticmethod
+    def refresh_revenue_rollup(start_date: date, end_date: date) -> int:
+        """
+        Recompute DailyRevenueRollup rows for a range of days.
+        
+        Every day in the range gets a row, zero when it had no paid
+        orders. Re-running over recent days picks up orders whose
+        status changed after the day closed.
+        
+        Args:
+            start_date: First day to roll up
+            end_date: Last day to roll up (inclusive)
+            
+        Returns:
+            int: Number of days written
+        """
+        daily = DashboardService._daily_revenue(start_date, end_date)
+        rows = []
+        for i in range((end_date - start_date).days + 1):
+            day = start_date + timedelta(days=i)
+            revenue, order_count = daily.get(day, (Decimal('0.00'), 0))
+            rows.append(DailyRevenueRollup(
+                date=day,
+                revenue=revenue,
+                order_count=order_count
+            ))
+        
+        DailyRevenueRollup.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['date'],
+            update_fields=['revenue', 'order_count', 'updated_at'],
+        )
+        return len(rows)
+    
+    @staticmethod
+    def refresh_revenue_days(*timestamps: datetime) -> None:
+        """
+        Recompute the rollup rows for the days of the given timestamps.
+        
+        Used when an order changes after its day may have been rolled
+        up. Open days (today onwards) are skipped, since they are always
+        aggregated live; None timestamps are ignored.
+        
+        Args:
+            *timestamps: Order created_at values whose days to refresh
+        """
+        today = timezone.localdate()
+        days = {
+            timezone.localtime(ts).date()
+            for ts in timestamps
+            if ts is not None
+        }
+        for day in sorted(d for d in days if d < today):
+            DashboardService.refresh_revenue_rollup(day, day)
+    
+    @staticmethod
+    def _daily_revenue(start_date: date, end_date: date) -> Dict[date, tuple]:
+        """
+        Aggregate paid revenue and order count per day in one query.
+        
+        Days without paid orders are absent from the result.
+        
+        Args:
+            start_date: First day to include
+            end_date: Last day to include (inclusive)
+            
+        Returns:
+            dict: Mapping of date to (revenue, order_count)
+        """
+        rows = Order.objects.filter(
+            created_at__gte=DashboardService._day_start(start_date),
+            created_at__lt=DashboardService._day_start(end_date + timedelta(days=1)),
+            is_deleted=False,
+            status__in=REVENUE_STATUSES
+        ).annotate(
+            day=TruncDate('created_at')
+        ).order_by().values('day').annotate(
+            total=Sum('total'),
+            count=Count('id')
+        )
+        return {row['day']: (row['total'], row['count']) for row in rows}
+    
     @staticmethod
     def get_low_stock_alerts(limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -206,19 +440,20 @@ class DashboardService:
             is_active=True,
             is_deleted=False,
             stock_quantity__lte=F('low_stock_threshold')
-        ).select_related('product').order_by('stock_quantity')[:limit]
-        
-        alerts = []
-        for variant in low_stock_variants:
-            alerts.append({
-                'variant_id': variant.id,
-                'variant_name': f"{variant.product.name} - {variant.name}",
-                'sku': variant.sku,
-                'stock_quantity': variant.stock_quantity,
-                'low_stock_threshold': variant.low_stock_threshold,
-            })
-        
-        return alerts
+        ).order_by('stock_quantity').values(
+            'id', 'name', 'sku', 'stock_quantity', 'low_stock_threshold', 'product__name'
+        )[:limit]
+        
+        return [
+            {
+                'variant_id': variant['id'],
+                'variant_name': f"{variant['product__name']} - {variant['name']}",
+                'sku': variant['sku'],
+                'stock_quantity': variant['stock_quantity'],
+                'low_stock_threshold': variant['low_stock_threshold'],
+            }
+            for variant in low_stock_variants
+        ]
     
     @staticmethod
     def get_recent_orders(limit: int = 10) -> List[Dict[str, Any]]:
@@ -231,24 +466,13 @@ class DashboardService:
         Returns:
             list: List of dictionaries containing order details
         """
-        orders = Order.objects.filter(
+        # Plain dicts of the listed columns; no model instances needed
+        return list(Order.objects.filter(
             is_deleted=False
-        ).select_related('user').order_by('-created_at')[:limit]
-        
-        recent_orders = []
-        for order in orders:
-            recent_orders.append({
-                'id': order.id,
-                'order_number': order.order_number,
-                'customer_name': order.customer_name,
-                'customer_phone': order.customer_phone,
-                'status': order.status,
-                'payment_status': order.payment_status,
-                'total': order.total,
-                'created_at': order.created_at,
-            })
-        
-        return recent_orders
+        ).order_by('-created_at').values(
+            'id', 'order_number', 'customer_name', 'customer_phone',
+            'status', 'payment_status', 'total', 'created_at'
+        )[:limit])
     
     @staticmethod
     def get_sales_by_status() -> Dict[str, int]:
@@ -271,12 +495,17 @@ class DashboardService:
         return result
     
     @staticmethod
-    def get_top_selling_products(limit: int = 5) -> List[Dict[str, Any]]:
+    def get_top_selling_products(limit: int = 5, days: int = 90) -> List[Dict[str, Any]]:
         """
         Get top selling products by quantity sold.
         
+        Only orders from the last `days` days are counted, so the
+        aggregation reads a bounded slice of order history through the
+        live-orders created_at index instead of every item ever sold.
+        
         Args:
             limit: Number of products to return
+            days: Size of the sales window in days (default 90)
             
         Returns:
             list: List of dictionaries containing:
@@ -287,9 +516,12 @@ class DashboardService:
         """
         from apps.orders.models import OrderItem
         
+        since = timezone.now() - timedelta(days=days)
+        
         top_products = OrderItem.objects.filter(
+            order__created_at__gte=since,
             order__is_deleted=False,
-            order__status__in=['confirmed', 'processing', 'shipped', 'delivered']
+            order__status__in=REVENUE_STATUSES
         ).values(
             'product_name', 'variant_name'
         ).annotate(
@@ -299,6 +531,22 @@ class DashboardService:
         
         return list(top_products)
     
+    @staticmethod
+    def _day_start(day: date) -> datetime:
+        """
+        Get the first moment of a day in the current time zone.
+        
+        Filtering on created_at__date wraps the column in a cast, which
+        rules out its index; comparing against day starts doesn't.
+        
+        Args:
+            day: Calendar day
+            
+        Returns:
+            datetime: Aware midnight starting that day
+        """
+        return timezone.make_aware(datetime.combine(day, time.min))
+    
     @staticmethod
     def _calculate_percentage_change(old_value: float, new_value: float) -> float:
         """
@@ -0,0 +1,79 @@
+"""
+Dashboard Signals.
+
+Invalidates cached dashboard figures when the records they are built
+from change. Cart writes are deliberately not connected: they are the
+most frequent writes in the shop, and abandoned-cart figures only count
+carts older than a day, so the short cache timeout is enough there.
+
+Order writes also recompute the revenue rollup for the order's day, so
+cancellations, refunds and deletions of orders from closed days reach
+the revenue charts without waiting for the scheduled refresh.
+
+Signals are registered automatically when the app is ready.
+"""
+
+from django.db.models.signals import post_delete, post_init, post_save
+
+from apps.engagement.models import ProductReview
+from apps.orders.models import Order, OrderItem
+from apps.products.models import ProductVariant
+
+from .services import DashboardService
+
+# Models whose writes change dashboard figures
+DASHBOARD_SOURCE_MODELS = (Order, OrderItem, ProductReview, ProductVariant)
+
+
+def remember_order_created_at(sender: type, instance: Order, **kwargs: object) -> None:
+    """
+    Record the created_at an order was loaded with.
+
+    Lets the rollup refresh cover the old day too if created_at changes.
+    Deferred created_at values are not loaded here.
+
+    Args:
+        sender: The Order model class.
+        instance: The order being initialised.
+        **kwargs: Additional signal arguments.
+    """
+    instance._loaded_created_at = instance.__dict__.get("created_at")
+
+
+def refresh_order_revenue_rollup(sender: type, instance: Order, **kwargs: object) -> None:
+    """
+    Recompute the rollup rows for an order's old and new creation days.
+
+    Args:
+        sender: The Order model class.
+        instance: The order that was saved or deleted.
+        **kwargs: Additional signal arguments.
+    """
+    if kwargs.get("raw"):
+        return
+    created_at = instance.__dict__.get("created_at")
+    DashboardService.refresh_revenue_days(
+        getattr(instance, "_loaded_created_at", None), created_at
+    )
+    instance._loaded_created_at = created_at
+
+
+def invalidate_dashboard_cache(sender: type, **kwargs: object) -> None:
+    """
+    Drop cached dashboard figures after a relevant save or delete.
+
+    Args:
+        sender: The model class that was saved or deleted.
+        **kwargs: Additional signal arguments.
+    """
+    DashboardService.invalidate_cache()
+
+
+post_init.connect(remember_order_created_at, sender=Order)
+# Connected before cache invalidation so rebuilt figures see the new rows
+post_save.connect(refresh_order_revenue_rollup, sender=Order)
+post_delete.connect(refresh_order_revenue_rollup, sender=Order)
+
+for model in DASHBOARD_SOURCE_MODELS:
+    post_save.connect(invalidate_dashboard_cache, sender=model)
+    post_delete.connect(invalidate_dashboard_cache, sender=model)
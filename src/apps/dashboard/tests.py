@@ -6,12 +6,18 @@ This module tests dashboard services, views, and statistics calculations.
 
 from datetime import timedelta
 from decimal import Decimal
+from io import StringIO
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase, Client
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, Client, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
+from apps.dashboard.models import DailyRevenueRollup
 from apps.dashboard.services import DashboardService
 from apps.orders.models import Order, Cart, CartItem
 from apps.products.models import (
@@ -94,6 +100,32 @@ class DashboardServiceTest(TestCase):
         self.assertIsInstance(stats['new_customers'], int)
         self.assertIsInstance(stats['pending_reviews'], int)
     
+    def test_get_today_stats_query_count(self):
+        """Test orders, customers and reviews take one query each."""
+        with self.assertNumQueries(3):
+            DashboardService.get_today_stats()
+    
+    def test_get_today_stats_day_boundary(self):
+        """Test an order just before local midnight counts as yesterday's."""
+        order = Order.objects.create(
+            customer_name='Test Customer',
+            customer_email='test@example.com',
+            customer_phone='01712345678',
+            shipping_address_line1='123 Test St',
+            shipping_city='Dhaka',
+            shipping_area='Gulshan',
+            payment_method='cod',
+            subtotal=Decimal('100.00'),
+            total=Decimal('100.00')
+        )
+        today_start = DashboardService._day_start(timezone.now().date())
+        Order.objects.filter(pk=order.pk).update(created_at=today_start - timedelta(minutes=1))
+        
+        stats = DashboardService.get_today_stats()
+        
+        self.assertEqual(stats['orders_count'], 0)
+        self.assertEqual(stats['orders_change'], -100.0)
+    
     def test_get_abandoned_carts(self):
         """Test abandoned cart statistics."""
         # Create cart older than 24 hours
@@ -118,6 +150,34 @@ class DashboardServiceTest(TestCase):
         self.assertEqual(abandoned['count'], 1)
         self.assertEqual(abandoned['potential_revenue'], Decimal('200.00'))
     
+    def test_get_abandoned_carts_single_query(self):
+        """Test abandoned carts are counted and totalled in one query."""
+        old_time = timezone.now() - timedelta(hours=25)
+        for quantity in (1, 3):
+            cart = Cart.objects.create(
+                session_key=f'session-{quantity}',
+                expires_at=old_time + timedelta(days=30)
+            )
+            Cart.objects.filter(pk=cart.pk).update(created_at=old_time)
+            CartItem.objects.create(
+                cart=cart,
+                variant=self.variant,
+                quantity=quantity,
+                unit_price=Decimal('50.00')
+            )
+        # Empty carts are not abandoned
+        empty = Cart.objects.create(
+            session_key='session-empty',
+            expires_at=old_time + timedelta(days=30)
+        )
+        Cart.objects.filter(pk=empty.pk).update(created_at=old_time)
+        
+        with self.assertNumQueries(1):
+            abandoned = DashboardService.get_abandoned_carts()
+        
+        self.assertEqual(abandoned['count'], 2)
+        self.assertEqual(abandoned['potential_revenue'], Decimal('200.00'))
+    
     def test_get_revenue_chart(self):
         """Test revenue chart data generation."""
         # Create order
@@ -143,6 +203,121 @@ class DashboardServiceTest(TestCase):
         self.assertEqual(len(chart_data['labels']), 7)
         self.assertEqual(len(chart_data['data']), 7)
     
+    def test_get_revenue_chart_grouped_query(self):
+        """Test the chart reads the rollup and groups live revenue in one query."""
+        three_days_ago = timezone.now() - timedelta(days=3)
+        for status, total in (('confirmed', '100.00'), ('delivered', '150.00'), ('pending', '75.00')):
+            order = Order.objects.create(
+                customer_name='Test Customer',
+                customer_email='test@example.com',
+                customer_phone='01712345678',
+                shipping_address_line1='123 Test St',
+                shipping_city='Dhaka',
+                shipping_area='Gulshan',
+                status=status,
+                payment_method='cod',
+                subtotal=Decimal(total),
+                total=Decimal(total)
+            )
+            Order.objects.filter(pk=order.pk).update(created_at=three_days_ago)
+        
+        with self.assertNumQueries(2):
+            chart_data = DashboardService.get_revenue_chart(days=7)
+        
+        self.assertEqual(sum(chart_data['data']), 250.0)
+        self.assertEqual(chart_data['data'].count(0.0), 6)
+    
+    def test_get_revenue_chart_reads_rollup(self):
+        """Test closed days come from the rollup instead of orders."""
+        yesterday = timezone.now().date() - timedelta(days=1)
+        DailyRevenueRollup.objects.create(date=yesterday, revenue=Decimal('500.00'), order_count=2)
+        
+        chart_data = DashboardService.get_revenue_chart(days=7)
+        
+        self.assertEqual(chart_data['data'][-2], 500.0)
+    
+    def test_refresh_revenue_rollup(self):
+        """Test every day in the range is upserted, empty days as zero."""
+        today = timezone.now().date()
+        start_date = today - timedelta(days=2)
+        DailyRevenueRollup.objects.create(date=start_date, revenue=Decimal('999.00'), order_count=9)
+        
+        written = DashboardService.refresh_revenue_rollup(start_date, today)
+        
+        self.assertEqual(written, 3)
+        rows = DailyRevenueRollup.objects.order_by('date')
+        self.assertEqual([row.date for row in rows], [start_date + timedelta(days=i) for i in range(3)])
+        self.assertEqual(rows[0].revenue, Decimal('0.00'))
+        self.assertEqual(rows[0].order_count, 0)
+    
+    def test_refresh_revenue_rollup_command(self):
+        """Test the command rolls up the requested closed days."""
+        call_command('refresh_revenue_rollup', days=3, stdout=StringIO())
+        
+        yesterday = timezone.now().date() - timedelta(days=1)
+        self.assertEqual(
+            list(DailyRevenueRollup.objects.order_by('date').values_list('date', flat=True)),
+            [yesterday - timedelta(days=2), yesterday - timedelta(days=1), yesterday],
+        )
+    
+    def _create_rolled_up_order(self, days_ago):
+        """Create a confirmed order on a closed day and roll that day up."""
+        order = Order.objects.create(
+            customer_name='Test Customer',
+            customer_email='test@example.com',
+            customer_phone='01712345678',
+            shipping_address_line1='123 Test St',
+            shipping_city='Dhaka',
+            shipping_area='Gulshan',
+            status='confirmed',
+            payment_method='cod',
+            subtotal=Decimal('100.00'),
+            total=Decimal('100.00')
+        )
+        Order.objects.filter(pk=order.pk).update(
+            created_at=timezone.now() - timedelta(days=days_ago)
+        )
+        call_command('refresh_revenue_rollup', stdout=StringIO())
+        self.assertEqual(sum(DashboardService.get_revenue_chart(days=7)['data']), 100.0)
+        return Order.objects.get(pk=order.pk)
+    
+    def test_old_order_status_change_refreshes_rollup(self):
+        """Test cancelling an order from a rolled-up day updates the chart."""
+        order = self._create_rolled_up_order(days_ago=5)
+        
+        order.status = 'cancelled'
+        order.save()
+        
+        self.assertEqual(sum(DashboardService.get_revenue_chart(days=7)['data']), 0.0)
+        self.assertEqual(DailyRevenueRollup.objects.filter(order_count__gt=0).count(), 0)
+    
+    def test_old_order_delete_refreshes_rollup(self):
+        """Test soft- and hard-deleting old orders updates the chart."""
+        for delete in ('delete', 'hard_delete'):
+            with self.subTest(delete=delete):
+                order = self._create_rolled_up_order(days_ago=4)
+                
+                getattr(order, delete)()
+                
+                self.assertEqual(sum(DashboardService.get_revenue_chart(days=7)['data']), 0.0)
+    
+    def test_today_order_save_skips_rollup(self):
+        """Test saving an order from today doesn't write rollup rows."""
+        Order.objects.create(
+            customer_name='Test Customer',
+            customer_email='test@example.com',
+            customer_phone='01712345678',
+            shipping_address_line1='123 Test St',
+            shipping_city='Dhaka',
+            shipping_area='Gulshan',
+            status='confirmed',
+            payment_method='cod',
+            subtotal=Decimal('100.00'),
+            total=Decimal('100.00')
+        )
+        
+        self.assertFalse(DailyRevenueRollup.objects.exists())
+    
     def test_get_low_stock_alerts(self):
         """Test low stock alerts."""
         # Variant already has stock (5) <= threshold (10)
@@ -151,6 +326,7 @@ class DashboardServiceTest(TestCase):
         self.assertGreater(len(alerts), 0)
         self.assertEqual(alerts[0]['sku'], 'TEST-001')
         self.assertEqual(alerts[0]['stock_quantity'], 5)
+        self.assertEqual(alerts[0]['variant_name'], f'{self.product.name} - Default')
     
     def test_get_recent_orders(self):
         """Test recent orders retrieval."""
@@ -248,6 +424,61 @@ class DashboardServiceTest(TestCase):
         self.assertEqual(len(top_products), 1)
         self.assertEqual(top_products[0]['quantity_sold'], 2)
         self.assertEqual(top_products[0]['revenue'], Decimal('200.00'))
+        
+        # Sales older than the window are left out
+        Order.objects.filter(pk=order.pk).update(created_at=timezone.now() - timedelta(days=91))
+        self.assertEqual(DashboardService.get_top_selling_products(limit=5), [])
+    
+    def test_cached_reuses_result(self):
+        """Test cached() serves repeat calls without querying."""
+        cache.clear()
+        first = DashboardService.cached('get_revenue_chart', days=7)
+        
+        with self.assertNumQueries(0):
+            second = DashboardService.cached('get_revenue_chart', days=7)
+        
+        self.assertEqual(second, first)
+        with self.assertNumQueries(2):
+            DashboardService.cached('get_revenue_chart', days=30)
+    
+    @override_settings(DASHBOARD_QUERY_WORKERS=3)
+    def test_cached_many_concurrent(self):
+        """Test concurrent cached_many() returns the same results as serial."""
+        cache.clear()
+        calls = {
+            'sales_by_status': ('get_sales_by_status', {}),
+            'top_products': ('get_top_selling_products', {'limit': 5}),
+        }
+        
+        concurrent = DashboardService.cached_many(**calls)
+        
+        with override_settings(DASHBOARD_QUERY_WORKERS=1):
+            cache.clear()
+            serial = DashboardService.cached_many(**calls)
+        self.assertEqual(concurrent, serial)
+    
+    def test_cache_serves_stale_while_locked(self):
+        """Test a request that finds a recompute running gets the last value."""
+        cache.clear()
+        DashboardService.cache_get_or_set('figure', lambda: 'old')
+        DashboardService.invalidate_cache()
+        cache.add('dashboard:lock:figure', 1)
+        
+        value = DashboardService.cache_get_or_set('figure', lambda: 'new')
+        
+        self.assertEqual(value, 'old')
+        cache.delete('dashboard:lock:figure')
+        self.assertEqual(DashboardService.cache_get_or_set('figure', lambda: 'new'), 'new')
+    
+    def test_invalidate_cache(self):
+        """Test invalidation makes cached() recompute."""
+        cache.clear()
+        DashboardService.cached('get_sales_by_status')
+        
+        DashboardService.invalidate_cache()
+        
+        with self.assertNumQueries(1):
+            DashboardService.cached('get_sales_by_status')
     
     def test_calculate_percentage_change(self):
         """Test percentage change calculation."""
@@ -342,3 +573,93 @@ class DashboardViewTest(TestCase):
         self.client.login(email='staff@example.com', password='staffpass123')
         response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
+    
+    def test_dashboard_ajax_invalidated_by_order_save(self):
+        """Test a new order shows up despite the cached payload."""
+        cache.clear()
+        self.client.login(email='staff@example.com', password='staffpass123')
+        url = reverse('dashboard:ajax')
+        self.client.get(url)
+        
+        Order.objects.create(
+            customer_name='Test Customer',
+            customer_email='test@example.com',
+            customer_phone='01712345678',
+            shipping_address_line1='123 Test St',
+            shipping_city='Dhaka',
+            shipping_area='Gulshan',
+            payment_method='cod',
+            subtotal=Decimal('100.00'),
+            total=Decimal('100.00')
+        )
+        response = self.client.get(url)
+        
+        self.assertEqual(len(response.json()['recent_orders']), 1)
+    
+    def test_dashboard_ajax_serves_cached_body(self):
+        """Test a repeat request returns the cached JSON body unchanged."""
+        cache.clear()
+        self.client.login(email='staff@example.com', password='staffpass123')
+        url = reverse('dashboard:ajax')
+        
+        first = self.client.get(url)
+        second = self.client.get(url)
+        
+        self.assertEqual(second['Content-Type'], 'application/json')
+        self.assertEqual(second.content, first.content)
+    
+    def test_dashboard_ajax_not_modified(self):
+        """Test a poll with a matching ETag gets an empty 304."""
+        cache.clear()
+        self.client.login(email='staff@example.com', password='staffpass123')
+        url = reverse('dashboard:ajax')
+        etag = self.client.get(url)['ETag']
+        
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+    
+    def test_dashboard_ajax_reuses_callback_figures(self):
+        """Test the first refresh after a page render needs no aggregation."""
+        from apps.dashboard.views import dashboard_callback
+        
+        cache.clear()
+        context = dashboard_callback(None, {})
+        self.assertLessEqual(len(context['dashboard_stats']['recent_orders']), 5)
+        self.client.login(email='staff@example.com', password='staffpass123')
+        
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse('dashboard:ajax'))
+        
+        self.assertFalse(any('orders_order' in query['sql'] for query in queries))
+    
+    def test_dashboard_ajax_force_recomputes(self):
+        """Test ?force=1 bypasses cached figures."""
+        cache.clear()
+        self.client.login(email='staff@example.com', password='staffpass123')
+        url = reverse('dashboard:ajax')
+        self.client.get(url)
+        
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(url, {'force': '1'})
+        
+        self.assertTrue(any('orders_order' in query['sql'] for query in queries))
+    
+    def test_dashboard_widget_returns_single_figure(self):
+        """Test a widget endpoint returns just that widget's data."""
+        cache.clear()
+        self.client.login(email='staff@example.com', password='staffpass123')
+        
+        response = self.client.get(reverse('dashboard:widget', args=['abandoned_carts']))
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'count': 0, 'potential_revenue': 0.0})
+    
+    def test_dashboard_widget_unknown_name(self):
+        """Test an unknown widget name is a 404."""
+        self.client.login(email='staff@example.com', password='staffpass123')
+        
+        response = self.client.get(reverse('dashboard:widget', args=['nope']))
+        
+        self.assertEqual(response.status_code, 404)
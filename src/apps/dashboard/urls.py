@@ -8,5 +8,6 @@ app_name = 'dashboard'
 
 urlpatterns = [
     path('ajax/', views.dashboard_ajax, name='ajax'),
+    path('widget/<slug:name>/', views.dashboard_widget, name='widget'),
     path('analytics/', views.analytics_view, name='analytics'),
 ]
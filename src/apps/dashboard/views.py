@@ -5,12 +5,33 @@ This module provides custom dashboard views and callbacks for the
 Django Unfold admin interface, displaying key metrics and statistics.
 """
 
-from typing import Dict, Any
+import hashlib
+import json
+from typing import Callable, Dict, Any
 
 from django.contrib.admin.views.decorators import staff_member_required
-from django.http import JsonResponse
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import Http404, HttpResponse
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
 
-from .services import DashboardService
+from .services import CACHE_TIMEOUT, DashboardService
+
+# Analytics figures cover 30 days, so they can be served staler
+ANALYTICS_CACHE_TIMEOUT = 120
+
+# Rows in the AJAX lists, and the shorter lists on the rendered page
+LIST_LIMIT = 10
+WIDGET_LIST_LIMIT = 5
+
+# Dashboard widgets: name -> (DashboardService method, kwargs)
+DASHBOARD_WIDGETS = {
+    'today_stats': ('get_today_stats', {}),
+    'abandoned_carts': ('get_abandoned_carts', {}),
+    'revenue_chart': ('get_revenue_chart', {'days': 7}),
+    'low_stock': ('get_low_stock_alerts', {'limit': LIST_LIMIT}),
+    'recent_orders': ('get_recent_orders', {'limit': LIST_LIMIT}),
+}
 
 
 def dashboard_callback(request, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -27,22 +48,26 @@ def dashboard_callback(request, context: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         dict: Updated context dictionary with dashboard data
     """
-    # Get statistics
-    today_stats = DashboardService.get_today_stats()
-    abandoned_carts = DashboardService.get_abandoned_carts()
-    revenue_chart = DashboardService.get_revenue_chart(days=7)
-    low_stock = DashboardService.get_low_stock_alerts(limit=5)
-    recent_orders = DashboardService.get_recent_orders(limit=5)
-    
-    # Add dashboard data to context
+    # Get statistics (cached briefly). Lists are fetched with the AJAX
+    # endpoint's limit so the page's first refresh is all cache hits.
+    dashboard_stats = DashboardService.cached_many(
+        today=('get_today_stats', {}),
+        abandoned_carts=('get_abandoned_carts', {}),
+        revenue_chart=('get_revenue_chart', {'days': 7}),
+        low_stock=('get_low_stock_alerts', {'limit': LIST_LIMIT}),
+        recent_orders=('get_recent_orders', {'limit': LIST_LIMIT}),
+    )
+    dashboard_stats['low_stock'] = dashboard_stats['low_stock'][:WIDGET_LIST_LIMIT]
+    dashboard_stats['recent_orders'] = dashboard_stats['recent_orders'][:WIDGET_LIST_LIMIT]
+    
+    # Add dashboard data to context, with per-widget URLs for templates
+    # that load widgets lazily
     context.update({
-        'dashboard_stats': {
-            'today': today_stats,
-            'abandoned_carts': abandoned_carts,
-            'revenue_chart': revenue_chart,
-            'low_stock': low_stock,
-            'recent_orders': recent_orders,
-        }
+        'dashboard_stats': dashboard_stats,
+        'dashboard_widget_urls': {
+            name: reverse('dashboard:widget', args=[name])
+            for name in DASHBOARD_WIDGETS
+        },
     })
     
     return context
@@ -54,36 +79,79 @@ def dashboard_ajax(request):
     AJAX endpoint for refreshing dashboard data.
     
     Returns JSON data for dynamic dashboard updates without page reload.
+    Pass ?force=1 (e.g. from a refresh button) to recompute everything
+    instead of serving cached figures.
     
     Args:
         request: HTTP request object
         
     Returns:
-        JsonResponse: Dashboard statistics as JSON
+        HttpResponse: Dashboard statistics as JSON
     """
-    today_stats = DashboardService.get_today_stats()
-    abandoned_carts = DashboardService.get_abandoned_carts()
-    revenue_chart = DashboardService.get_revenue_chart(days=7)
-    low_stock = DashboardService.get_low_stock_alerts(limit=10)
-    recent_orders = DashboardService.get_recent_orders(limit=10)
-    
-    return JsonResponse({
-        'today_stats': {
-            'orders_count': today_stats['orders_count'],
-            'orders_change': today_stats['orders_change'],
-            'revenue': float(today_stats['revenue']),
-            'revenue_change': today_stats['revenue_change'],
-            'new_customers': today_stats['new_customers'],
-            'customers_change': today_stats['customers_change'],
-            'pending_reviews': today_stats['pending_reviews'],
-        },
-        'abandoned_carts': {
-            'count': abandoned_carts['count'],
-            'potential_revenue': float(abandoned_carts['potential_revenue']),
-        },
-        'revenue_chart': revenue_chart,
-        'low_stock': low_stock,
-        'recent_orders': [
+    if request.GET.get('force'):
+        DashboardService.invalidate_cache()
+    
+    return _cached_json_response(request, 'ajax', _dashboard_payload)
+
+
+def _cached_json_response(
+    request,
+    name: str,
+    build_payload: Callable[[], Dict[str, Any]],
+    timeout: int = CACHE_TIMEOUT,
+) -> HttpResponse:
+    """
+    Return a JSON response whose encoded body is cached.
+    
+    The body is stored already serialized, so a cache hit skips both
+    rebuilding and re-encoding the payload. The response carries an ETag
+    of the body; a poll whose If-None-Match still matches gets an empty
+    304 instead.
+    
+    Args:
+        request: HTTP request object
+        name: Cache key suffix for the payload
+        build_payload: Callable returning the JSON-ready payload
+        timeout: Seconds to keep the body
+        
+    Returns:
+        HttpResponse: application/json response, or 304 Not Modified
+    """
+    body = DashboardService.cache_get_or_set(
+        f'{name}:json',
+        lambda: json.dumps(build_payload(), cls=DjangoJSONEncoder),
+        timeout=timeout,
+    )
+    etag = f'"{hashlib.md5(body.encode(), usedforsecurity=False).hexdigest()}"'
+    
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        return not_modified
+    
+    response = HttpResponse(body, content_type='application/json')
+    response['ETag'] = etag
+    # Let the browser keep the body but revalidate on every poll
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def _dashboard_payload() -> Dict[str, Any]:
+    """Build the JSON-ready data returned by dashboard_ajax."""
+    stats = DashboardService.cached_many(**DASHBOARD_WIDGETS)
+    return {name: _widget_json(name, value) for name, value in stats.items()}
+
+
+def _widget_json(name: str, value: Any) -> Any:
+    """Convert one dashboard figure to its JSON-ready form."""
+    if name == 'today_stats':
+        return {**value, 'revenue': float(value['revenue'])}
+    if name == 'abandoned_carts':
+        return {
+            'count': value['count'],
+            'potential_revenue': float(value['potential_revenue']),
+        }
+    if name == 'recent_orders':
+        return [
             {
                 'order_number': order['order_number'],
                 'customer_name': order['customer_name'],
@@ -92,9 +160,39 @@ def dashboard_ajax(request):
                 'total': float(order['total']),
                 'created_at': order['created_at'].isoformat(),
             }
-            for order in recent_orders
-        ],
-    })
+            for order in value
+        ]
+    return value
+
+
+@staff_member_required
+def dashboard_widget(request, name: str):
+    """
+    AJAX endpoint for a single dashboard widget.
+    
+    Lets a dashboard page render placeholders first and fill each widget
+    as its figure arrives, instead of waiting for all of them. Each widget
+    has its own cached body and ETag.
+    
+    Args:
+        request: HTTP request object
+        name: Widget name, a key of DASHBOARD_WIDGETS
+        
+    Returns:
+        HttpResponse: The widget's data as JSON
+        
+    Raises:
+        Http404: If the widget name is unknown
+    """
+    if name not in DASHBOARD_WIDGETS:
+        raise Http404(f"Unknown dashboard widget: {name}")
+    
+    method_name, kwargs = DASHBOARD_WIDGETS[name]
+    return _cached_json_response(
+        request,
+        f'widget:{name}',
+        lambda: _widget_json(name, DashboardService.cached(method_name, **kwargs)),
+    )
 
 
 @staff_member_required
@@ -109,15 +207,24 @@ def analytics_view(request):
         request: HTTP request object
         
     Returns:
-        JsonResponse: Analytics data
+        HttpResponse: Analytics data as JSON
     """
-    revenue_30_days = DashboardService.get_revenue_chart(days=30)
-    sales_by_status = DashboardService.get_sales_by_status()
-    top_products = DashboardService.get_top_selling_products(limit=10)
+    return _cached_json_response(
+        request, 'analytics', _analytics_payload, timeout=ANALYTICS_CACHE_TIMEOUT
+    )
+
+
+def _analytics_payload() -> Dict[str, Any]:
+    """Build the JSON-ready data returned by analytics_view."""
+    stats = DashboardService.cached_many(
+        revenue_30_days=('get_revenue_chart', {'days': 30}),
+        sales_by_status=('get_sales_by_status', {}),
+        top_products=('get_top_selling_products', {'limit': 10}),
+    )
     
-    return JsonResponse({
-        'revenue_30_days': revenue_30_days,
-        'sales_by_status': sales_by_status,
+    return {
+        'revenue_30_days': stats['revenue_30_days'],
+        'sales_by_status': stats['sales_by_status'],
         'top_products': [
             {
                 'product_name': p['product_name'],
@@ -125,7 +232,7 @@ def analytics_view(request):
                 'quantity_sold': p['quantity_sold'],
                 'revenue': float(p['revenue']),
             }
-            for p in top_products
+            for p in stats['top_products']
         ],
-    })
+    }
 
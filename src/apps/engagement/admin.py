@@ -10,7 +10,7 @@ This module provides admin interfaces for:
 from typing import Any
 
 from django.contrib import admin
-from django.db.models import QuerySet
+from django.db.models import BooleanField, ExpressionWrapper, Q, QuerySet
 from django.http import HttpRequest
 from django.utils.html import format_html
 from unfold.admin import ModelAdmin as BaseModelAdmin
@@ -19,6 +19,12 @@ from apps.core.admin import TimeStampedAdminMixin
 from apps.engagement.models import ProductReview, Wishlist, WishlistItem
 
 
+def _is_changelist(request: HttpRequest) -> bool:
+    """Return True if the request is for a model admin changelist page."""
+    match = getattr(request, "resolver_match", None)
+    return bool(match and match.url_name and match.url_name.endswith("_changelist"))
+
+
 @admin.register(ProductReview)
 class ProductReviewAdmin(TimeStampedAdminMixin, BaseModelAdmin):
     """
@@ -40,7 +46,13 @@ class ProductReviewAdmin(TimeStampedAdminMixin, BaseModelAdmin):
         "has_reply_badge",
         "created_at",
     ]
-    list_filter = ["is_approved", "rating", "created_at"]
+    list_filter = [
+        "is_approved",
+        "rating",
+        # Filters on the admin_reply column itself, in SQL
+        ("admin_reply", admin.EmptyFieldListFilter),
+        "created_at",
+    ]
     search_fields = [
         "user__email",
         "product__name",
@@ -95,6 +107,23 @@ class ProductReviewAdmin(TimeStampedAdminMixin, BaseModelAdmin):
     ]
     autocomplete_fields = ["user", "product"]
 
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        """
+        Optimize queryset with select_related.
+
+        On the changelist, large unlisted columns are skipped and the
+        reply flag is computed in SQL. The change form loads full rows,
+        since it renders those columns.
+        """
+        qs = super().get_queryset(request).select_related("user", "product")
+        if not _is_changelist(request):
+            return qs
+        return qs.annotate(
+            _has_reply=ExpressionWrapper(
+                ~Q(admin_reply=""), output_field=BooleanField()
+            )
+        ).defer("comment", "images", "admin_reply")
+
     @admin.display(description="User")
     def user_email(self, obj: ProductReview) -> str:
         """Display user email."""
@@ -126,10 +155,10 @@ class ProductReviewAdmin(TimeStampedAdminMixin, BaseModelAdmin):
             'padding: 3px 10px; border-radius: 3px;">Pending</span>'
         )
 
-    @admin.display(description="Admin Reply", boolean=True)
+    @admin.display(description="Admin Reply", boolean=True, ordering="_has_reply")
     def has_reply_badge(self, obj: ProductReview) -> bool:
-        """Show if admin has replied."""
-        return obj.has_admin_reply
+        """Show if admin has replied, from the annotated flag."""
+        return obj._has_reply
 
     @admin.action(description="Approve selected reviews")
     def approve_reviews(self, request: HttpRequest, queryset: QuerySet) -> None:
@@ -155,6 +184,11 @@ class WishlistItemInline(admin.TabularInline):
     readonly_fields = ["variant", "created_at"]
     can_delete = False
 
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        """Load each variant and its product for the variant column."""
+        qs = super().get_queryset(request)
+        return qs.select_related("variant__product")
+
     def has_add_permission(self, request: HttpRequest, obj: Any = None) -> bool:
         """Disable manual addition."""
         return False
@@ -202,6 +236,11 @@ class WishlistAdmin(TimeStampedAdminMixin, BaseModelAdmin):
     inlines = [WishlistItemInline]
     autocomplete_fields = ["user"]
 
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        """Load users in the changelist query."""
+        qs = super().get_queryset(request)
+        return qs.select_related("user")
+
     def has_add_permission(self, request: HttpRequest) -> bool:
         """Disable manual creation (auto-created via service)."""
         return False
@@ -217,10 +256,10 @@ class WishlistAdmin(TimeStampedAdminMixin, BaseModelAdmin):
         """Display user email."""
         return obj.user.email
 
-    @admin.display(description="Items")
+    @admin.display(description="Items", ordering="items_count")
     def item_count_display(self, obj: Wishlist) -> str:
         """Display item count."""
-        count = obj.item_count
+        count = obj.items_count
         return format_html(
             '<strong style="color: #007bff;">{}</strong>', count
         )
@@ -248,6 +287,11 @@ class WishlistItemAdmin(BaseModelAdmin):
         "created_at",
     ]
 
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        """Optimize queryset with select_related."""
+        qs = super().get_queryset(request)
+        return qs.select_related("wishlist__user", "variant")
+
     def has_add_permission(self, request: HttpRequest) -> bool:
         """Disable manual addition."""
         return False
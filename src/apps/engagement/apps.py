@@ -12,4 +12,4 @@ class EngagementConfig(AppConfig):
 
     def ready(self) -> None:
         """Import signals when app is ready."""
-        pass
+        import apps.engagement.signals  # noqa: F401
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.15 on 2026-10-17 12:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("engagement", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="productreview",
+            index=models.Index(
+                condition=models.Q(("is_approved", False)),
+                fields=["-created_at"],
+                name="engagement_review_pending_idx",
+            ),
+        ),
+    ]
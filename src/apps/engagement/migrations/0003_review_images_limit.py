@@ -0,0 +1,28 @@
+# Generated by Django 5.1.15 on 2026-10-17 12:45
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("engagement", "0002_review_pending_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="productreview",
+            name="images",
+            field=models.JSONField(
+                blank=True,
+                default=list,
+                help_text="Array of image URLs",
+                validators=[
+                    django.core.validators.MaxLengthValidator(
+                        10, message="A review can have at most %(limit_value)d images."
+                    )
+                ],
+            ),
+        ),
+    ]
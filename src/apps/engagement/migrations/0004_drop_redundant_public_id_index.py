@@ -0,0 +1,19 @@
+# Generated by Django 5.1.15 on 2026-10-17 12:46
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("engagement", "0003_review_images_limit"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="wishlist",
+            name="public_id",
+            field=models.UUIDField(default=uuid.uuid4, editable=False, unique=True),
+        ),
+    ]
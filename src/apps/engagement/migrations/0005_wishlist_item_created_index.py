@@ -0,0 +1,19 @@
+# Generated by Django 5.1.15 on 2026-10-17 12:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("engagement", "0004_drop_redundant_public_id_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="wishlistitem",
+            index=models.Index(
+                fields=["wishlist", "-created_at"], name="engagement_wli_created_idx"
+            ),
+        ),
+    ]
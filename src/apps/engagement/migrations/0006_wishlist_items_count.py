@@ -0,0 +1,39 @@
+# Generated by Django 5.1.15 on 2026-10-17 12:48
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def populate_items_count(apps, schema_editor):
+    """Backfill items_count from the existing wishlist items."""
+    Wishlist = apps.get_model("engagement", "Wishlist")
+    WishlistItem = apps.get_model("engagement", "WishlistItem")
+    counts = (
+        WishlistItem.objects.filter(wishlist=OuterRef("pk"))
+        .order_by()
+        .values("wishlist")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    Wishlist.objects.update(items_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("engagement", "0005_wishlist_item_created_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="wishlist",
+            name="items_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Number of items; maintained by WishlistItem signals",
+            ),
+        ),
+        migrations.RunPython(populate_items_count, migrations.RunPython.noop),
+    ]
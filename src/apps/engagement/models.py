@@ -10,12 +10,15 @@ This module contains models for customer engagement:
 from typing import Any
 import uuid
 
-from django.core.validators import MinValueValidator, MaxValueValidator
+from django.core.validators import MaxLengthValidator, MinValueValidator, MaxValueValidator
 from django.db import models
 from django.utils import timezone
 
 from apps.core.models import TimeStampedModel
 
+# Most image URLs a single review may carry
+MAX_REVIEW_IMAGES = 10
+
 
 class ProductReview(TimeStampedModel):
     """
@@ -65,6 +68,12 @@ class ProductReview(TimeStampedModel):
     images = models.JSONField(
         default=list,
         blank=True,
+        validators=[
+            MaxLengthValidator(
+                MAX_REVIEW_IMAGES,
+                message="A review can have at most %(limit_value)d images.",
+            ),
+        ],
         help_text="Array of image URLs",
     )
     is_approved = models.BooleanField(
@@ -92,6 +101,13 @@ class ProductReview(TimeStampedModel):
             models.Index(fields=["user", "-created_at"]),
             models.Index(fields=["is_approved", "-created_at"]),
             models.Index(fields=["rating"]),
+            # Pending reviews only; small enough to stay cached for the
+            # dashboard's pending count and the moderation queue
+            models.Index(
+                fields=["-created_at"],
+                condition=models.Q(is_approved=False),
+                name="engagement_review_pending_idx",
+            ),
         ]
         # One review per user per product
         constraints = [
@@ -140,6 +156,7 @@ class Wishlist(TimeStampedModel):
     Attributes:
         public_id: UUID for external reference
         user: Wishlist owner
+        items_count: Number of items, kept current by engagement signals
         
     Example:
         wishlist = Wishlist.objects.create(user=user)
@@ -149,13 +166,17 @@ class Wishlist(TimeStampedModel):
         default=uuid.uuid4,
         unique=True,
         editable=False,
-        db_index=True,
     )
     user = models.OneToOneField(
         "users.User",
         on_delete=models.CASCADE,
         related_name="wishlist",
     )
+    items_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of items; maintained by WishlistItem signals",
+    )
 
     class Meta:
         db_table = "engagement_wishlist"
@@ -167,8 +188,14 @@ class Wishlist(TimeStampedModel):
 
     @property
     def item_count(self) -> int:
-        """Get total number of items in wishlist."""
-        return self.items.count()
+        """
+        Get total number of items in wishlist.
+
+        Reads the stored counter, so it is only as fresh as the last time
+        this instance was loaded. After adding or removing items, call
+        refresh_from_db(fields=["items_count"]) before reading it again.
+        """
+        return self.items_count
 
 
 class WishlistItem(TimeStampedModel):
@@ -211,6 +238,14 @@ class WishlistItem(TimeStampedModel):
                 name="unique_wishlist_variant",
             )
         ]
+        # Serves the per-wishlist listing in its default order; the unique
+        # constraint above leads with wishlist but can't supply the sort
+        indexes = [
+            models.Index(
+                fields=["wishlist", "-created_at"],
+                name="engagement_wli_created_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.wishlist.user.email} - {self.variant.name}"
@@ -12,7 +12,7 @@ from typing import Any
 
 from django.core.exceptions import ValidationError
 from django.db import transaction
-from django.db.models import Avg, Count
+from django.db.models import Avg, Count, Q
 
 
 class ReviewService:
@@ -113,21 +113,24 @@ class ReviewService:
         """
         from apps.engagement.models import ProductReview
 
-        approved_reviews = ProductReview.objects.filter(
+        # Average, total and per-star counts in one aggregate row
+        result = ProductReview.objects.filter(
             product=product, is_approved=True
+        ).aggregate(
+            avg_rating=Avg("rating"),
+            total=Count("id"),
+            **{f"r{i}": Count("id", filter=Q(rating=i)) for i in range(1, 6)},
         )
 
-        # Calculate distribution
-        distribution = {i: 0 for i in range(1, 6)}
-        for review in approved_reviews:
-            distribution[review.rating] += 1
-
-        avg_rating = ReviewService.calculate_average_rating(product)
+        if result["total"] == 0:
+            avg_rating = Decimal("0.0")
+        else:
+            avg_rating = Decimal(str(result["avg_rating"])).quantize(Decimal("0.1"))
 
         return {
             "average_rating": avg_rating,
-            "total_reviews": approved_reviews.count(),
-            "rating_distribution": distribution,
+            "total_reviews": result["total"],
+            "rating_distribution": {i: result[f"r{i}"] for i in range(1, 6)},
         }
 
 
@@ -0,0 +1,56 @@
+"""
+Engagement Signals.
+
+Keeps Wishlist.items_count in step with its WishlistItem rows so item
+counts are read from the wishlist row instead of counted per request.
+Updates use F() expressions so concurrent adds and removes don't lose
+increments.
+
+Signals are registered automatically when the app is ready.
+"""
+
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.engagement.models import Wishlist, WishlistItem
+
+
+@receiver(post_save, sender=WishlistItem)
+def increment_wishlist_items_count(
+    sender: type, instance: WishlistItem, created: bool, raw: bool = False, **kwargs: object
+) -> None:
+    """
+    Count a newly added wishlist item.
+
+    Fixture loads (raw saves) are skipped; their wishlist rows carry
+    their own counts.
+
+    Args:
+        sender: The WishlistItem model class.
+        instance: The item that was saved.
+        created: True if this is a new item, False if updating.
+        raw: True when loading fixtures.
+        **kwargs: Additional signal arguments.
+    """
+    if created and not raw:
+        Wishlist.objects.filter(pk=instance.wishlist_id).update(
+            items_count=F("items_count") + 1
+        )
+
+
+@receiver(post_delete, sender=WishlistItem)
+def decrement_wishlist_items_count(
+    sender: type, instance: WishlistItem, **kwargs: object
+) -> None:
+    """
+    Uncount a removed wishlist item.
+
+    Args:
+        sender: The WishlistItem model class.
+        instance: The item that was deleted.
+        **kwargs: Additional signal arguments.
+    """
+    Wishlist.objects.filter(pk=instance.wishlist_id, items_count__gt=0).update(
+        items_count=F("items_count") - 1
+    )
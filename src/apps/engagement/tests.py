@@ -0,0 +1,208 @@
+"""
+Tests for engagement app.
+
+This module tests the review admin querysets and wishlist item counts.
+"""
+
+from decimal import Decimal
+
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.core import serializers
+from django.test import TestCase, RequestFactory
+from django.urls import resolve, reverse
+from django.utils import timezone
+
+from apps.engagement.models import ProductReview, Wishlist, WishlistItem
+from apps.engagement.services import WishlistService
+from apps.products.models import (
+    Category,
+    Product,
+    ProductType,
+    ProductVariant,
+)
+
+User = get_user_model()
+
+
+class ProductReviewAdminQuerysetTest(TestCase):
+    """Test ProductReviewAdmin loads only what each page renders."""
+    
+    def setUp(self):
+        """Set up a review with an admin reply and an admin user."""
+        self.admin_user = User.objects.create_superuser(
+            email='admin@example.com',
+            password='adminpass123'
+        )
+        customer = User.objects.create_user(
+            email='customer@example.com',
+            phone='01712345678',
+            password='testpass123'
+        )
+        category = Category.objects.create(
+            name='Test Category',
+            slug='test-category',
+            status='active'
+        )
+        product_type = ProductType.objects.create(
+            name='Test Type',
+            slug='test-type',
+            is_active=True
+        )
+        product = Product.objects.create(
+            product_type=product_type,
+            category=category,
+            name='Test Product',
+            slug='test-product',
+            base_price=Decimal('100.00'),
+            status='published'
+        )
+        self.review = ProductReview.objects.create(
+            user=customer,
+            product=product,
+            rating=4,
+            comment='Solid product',
+            admin_reply='Thanks!',
+            is_approved=True
+        )
+        self.model_admin = admin.site._registry[ProductReview]
+        self.factory = RequestFactory()
+    
+    def _get_queryset(self, url):
+        """Return the admin queryset for a request to the given URL."""
+        request = self.factory.get(url)
+        request.user = self.admin_user
+        request.resolver_match = resolve(url)
+        return self.model_admin.get_queryset(request)
+    
+    def test_changelist_defers_large_columns(self):
+        """Test the changelist skips unlisted text and annotates the reply flag."""
+        qs = self._get_queryset(reverse('admin:engagement_productreview_changelist'))
+        
+        self.assertEqual(
+            qs.query.deferred_loading,
+            ({'comment', 'images', 'admin_reply'}, True)
+        )
+        self.assertTrue(qs.get(pk=self.review.pk)._has_reply)
+    
+    def test_change_form_loads_full_rows(self):
+        """Test the change form queryset defers nothing."""
+        url = reverse('admin:engagement_productreview_change', args=[self.review.pk])
+        review = self._get_queryset(url).get(pk=self.review.pk)
+        
+        self.assertEqual(review.get_deferred_fields(), set())
+    
+    def test_admin_pages_render(self):
+        """Test the changelist and change form render for staff."""
+        self.client.force_login(self.admin_user)
+        
+        changelist = self.client.get(reverse('admin:engagement_productreview_changelist'))
+        change = self.client.get(
+            reverse('admin:engagement_productreview_change', args=[self.review.pk])
+        )
+        
+        self.assertEqual(changelist.status_code, 200)
+        self.assertEqual(change.status_code, 200)
+
+
+class WishlistItemsCountTest(TestCase):
+    """Test Wishlist.items_count follows item adds and removals."""
+    
+    def setUp(self):
+        """Set up a user, their wishlist and two variants."""
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            phone='01712345678',
+            password='testpass123'
+        )
+        category = Category.objects.create(
+            name='Test Category',
+            slug='test-category',
+            status='active'
+        )
+        product_type = ProductType.objects.create(
+            name='Test Type',
+            slug='test-type',
+            is_active=True
+        )
+        product = Product.objects.create(
+            product_type=product_type,
+            category=category,
+            name='Test Product',
+            slug='test-product',
+            base_price=Decimal('100.00'),
+            status='published'
+        )
+        self.variant = ProductVariant.objects.create(
+            product=product,
+            sku='TEST-001',
+            name='Small',
+            price=Decimal('100.00'),
+            is_active=True
+        )
+        self.other_variant = ProductVariant.objects.create(
+            product=product,
+            sku='TEST-002',
+            name='Large',
+            price=Decimal('120.00'),
+            is_active=True
+        )
+        self.wishlist = WishlistService.get_or_create_wishlist(self.user)
+    
+    def assertItemCount(self, expected):
+        """Assert the stored count after reloading it from the database."""
+        self.wishlist.refresh_from_db(fields=['items_count'])
+        self.assertEqual(self.wishlist.item_count, expected)
+    
+    def test_add_and_remove_item(self):
+        """Test add_item and remove_item move the count by one."""
+        WishlistService.add_item(self.user, self.variant)
+        self.assertItemCount(1)
+        
+        WishlistService.add_item(self.user, self.other_variant)
+        self.assertItemCount(2)
+        
+        self.assertTrue(WishlistService.remove_item(self.user, self.variant))
+        self.assertItemCount(1)
+    
+    def test_duplicate_add_not_counted(self):
+        """Test adding a variant already in the wishlist keeps the count."""
+        WishlistService.add_item(self.user, self.variant)
+        WishlistService.add_item(self.user, self.variant)
+        
+        self.assertItemCount(1)
+    
+    def test_toggle_item(self):
+        """Test toggling adds then removes a counted item."""
+        self.assertTrue(WishlistService.toggle_item(self.user, self.variant)['added'])
+        self.assertItemCount(1)
+        
+        self.assertFalse(WishlistService.toggle_item(self.user, self.variant)['added'])
+        self.assertItemCount(0)
+    
+    def test_raw_save_skipped(self):
+        """Test fixture loads don't bump counts carried by wishlist rows."""
+        now = timezone.now()
+        item = WishlistItem(
+            wishlist=self.wishlist,
+            variant=self.variant,
+            created_at=now,
+            updated_at=now
+        )
+        data = serializers.serialize('json', [item])
+        
+        for obj in serializers.deserialize('json', data):
+            obj.save()
+        
+        self.assertTrue(WishlistItem.objects.filter(wishlist=self.wishlist).exists())
+        self.assertItemCount(0)
+    
+    def test_variant_delete_cascades_to_count(self):
+        """Test hard-deleting a variant uncounts its cascaded wishlist items."""
+        WishlistService.add_item(self.user, self.variant)
+        WishlistService.add_item(self.user, self.other_variant)
+        
+        self.variant.hard_delete()
+        
+        self.assertItemCount(1)
+        self.assertEqual(Wishlist.objects.get(pk=self.wishlist.pk).items.count(), 1)
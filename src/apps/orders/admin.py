@@ -471,11 +471,7 @@ class CouponAdmin(TimeStampedAdminMixin, BaseModelAdmin):
     @admin.action(description="Soft delete selected coupons")
     def soft_delete_coupons(self, request: HttpRequest, queryset: QuerySet) -> None:
         """Soft delete selected coupons."""
-        count = 0
-        for coupon in queryset:
-            if not coupon.is_deleted:
-                coupon.delete()
-                count += 1
+        count = Coupon.bulk_soft_delete(queryset)
         self.message_user(request, f"Deleted {count} coupons.")
 
     actions = ["activate_coupons", "deactivate_coupons", "soft_delete_coupons"]
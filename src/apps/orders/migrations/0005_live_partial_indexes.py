@@ -0,0 +1,41 @@
+# Generated by Django 5.1.15 on 2026-10-17 12:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0004_order_couponusage_order_orderitem_orderstatuslog_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="coupon",
+            name="is_deleted",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates if this record has been soft-deleted.",
+                verbose_name="Is Deleted",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="order",
+            name="is_deleted",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates if this record has been soft-deleted.",
+                verbose_name="Is Deleted",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["-created_at"],
+                name="orders_order_live_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.15 on 2026-10-17 12:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0006_order_number_sequence"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="order",
+            index=models.Index(
+                condition=models.Q(
+                    ("is_deleted", False),
+                    ("status__in", ("confirmed", "processing", "shipped", "delivered")),
+                ),
+                fields=["created_at"],
+                name="orders_order_revenue_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.15 on 2026-10-17 12:46
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("orders", "0007_order_revenue_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="order",
+            name="public_id",
+            field=models.UUIDField(default=uuid.uuid4, editable=False, unique=True),
+        ),
+    ]
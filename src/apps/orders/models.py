@@ -8,6 +8,7 @@ This module contains models for complete e-commerce order flow:
 - CouponUsage: Tracking coupon usage
 - ShippingZone: Area-based shipping costs
 - TaxRule: Tax calculation rules
+- OrderNumberSequence: Per-year order number counter
 - Order: Customer orders
 - OrderItem: Items in an order
 - OrderStatusLog: Order status change history
@@ -20,12 +21,15 @@ from typing import Any
 import uuid
 
 from django.core.validators import MinValueValidator
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
 from apps.core.models import SoftDeleteModel, TimeStampedModel
 from apps.core.managers import SoftDeleteManager, SoftDeleteAllManager
 
+# Order statuses whose totals count as revenue in reports
+REVENUE_STATUSES = ("confirmed", "processing", "shipped", "delivered")
+
 
 class Cart(TimeStampedModel):
     """
@@ -527,6 +531,72 @@ class TaxRule(TimeStampedModel):
         return float(self.rate)
 
 
+class OrderNumberSequence(models.Model):
+    """
+    Per-year counter backing sequential order numbers.
+
+    Each row holds the last number issued for a year. Numbers are taken
+    under a row lock, so concurrent checkouts never receive the same
+    order number and no scan of existing orders is needed.
+
+    Attributes:
+        year: Calendar year the counter applies to
+        last_number: Last number issued for that year
+    """
+
+    year = models.PositiveSmallIntegerField(unique=True)
+    last_number = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = "orders_order_number_sequence"
+        verbose_name = "Order Number Sequence"
+        verbose_name_plural = "Order Number Sequences"
+
+    def __str__(self) -> str:
+        return f"{self.year}: {self.last_number}"
+
+    @classmethod
+    def next_number(cls, year: int) -> int:
+        """
+        Reserve and return the next order number for a year.
+
+        The first call for a year seeds the counter from existing orders,
+        so numbering continues from orders created before the counter.
+
+        Args:
+            year: Calendar year to issue a number for.
+
+        Returns:
+            The reserved number (1-based).
+        """
+        with transaction.atomic():
+            counter = cls.objects.select_for_update().filter(year=year).first()
+            if counter is None:
+                cls.objects.get_or_create(
+                    year=year, defaults={"last_number": cls._last_issued(year)}
+                )
+                # Lock the row, whichever transaction created it
+                counter = cls.objects.select_for_update().get(year=year)
+
+            counter.last_number += 1
+            counter.save(update_fields=["last_number"])
+
+        return counter.last_number
+
+    @staticmethod
+    def _last_issued(year: int) -> int:
+        """Return the highest number already used by orders of a year."""
+        last_order_number = (
+            Order.all_objects.filter(order_number__startswith=f"ORD-{year}-")
+            .order_by("-order_number")
+            .values_list("order_number", flat=True)
+            .first()
+        )
+        if last_order_number is None:
+            return 0
+        return int(last_order_number.split("-")[-1])
+
+
 class Order(SoftDeleteModel):
     """
     Customer order with complete transaction details.
@@ -599,7 +669,7 @@ class Order(SoftDeleteModel):
     ]
 
     # Identification
-    public_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False, db_index=True)
+    public_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
     order_number = models.CharField(max_length=50, unique=True, db_index=True)
 
     # User (nullable for guest checkout)
@@ -700,6 +770,18 @@ class Order(SoftDeleteModel):
             models.Index(fields=["payment_status"]),
             models.Index(fields=["customer_email"]),
             models.Index(fields=["customer_phone"]),
+            # Live orders only; matches default ordering and date-range reports
+            models.Index(
+                fields=["-created_at"],
+                condition=models.Q(is_deleted=False),
+                name="orders_order_live_idx",
+            ),
+            # Revenue-counted live orders only; dashboard revenue by date
+            models.Index(
+                fields=["created_at"],
+                condition=models.Q(is_deleted=False, status__in=REVENUE_STATUSES),
+                name="orders_order_revenue_idx",
+            ),
         ]
 
     def __str__(self) -> str:
@@ -0,0 +1,48 @@
+# Generated by Django 5.1.15 on 2026-10-17 12:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0003_inventorylog"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="category",
+            name="is_deleted",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates if this record has been soft-deleted.",
+                verbose_name="Is Deleted",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="product",
+            name="is_deleted",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates if this record has been soft-deleted.",
+                verbose_name="Is Deleted",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="productvariant",
+            name="is_deleted",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates if this record has been soft-deleted.",
+                verbose_name="Is Deleted",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                condition=models.Q(("status", "published")),
+                fields=["-created_at"],
+                name="products_product_pub_idx",
+            ),
+        ),
+    ]
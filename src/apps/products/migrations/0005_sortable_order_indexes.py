@@ -0,0 +1,44 @@
+# Generated by Django 5.1.15 on 2026-10-17 12:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0004_live_partial_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="category",
+            name="sort_order",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="Display order. Lower numbers appear first.",
+                verbose_name="Sort Order",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="productimage",
+            name="sort_order",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="Display order. Lower numbers appear first.",
+                verbose_name="Sort Order",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(
+                fields=["sort_order", "name"], name="products_category_sort_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="productimage",
+            index=models.Index(
+                fields=["product", "sort_order", "-created_at"],
+                name="products_image_sort_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.15 on 2026-10-17 12:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0005_sortable_order_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="productvariant",
+            index=models.Index(
+                condition=models.Q(("is_active", True), ("is_deleted", False)),
+                fields=["stock_quantity"],
+                name="products_variant_stock_idx",
+            ),
+        ),
+    ]
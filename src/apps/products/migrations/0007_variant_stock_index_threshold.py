@@ -0,0 +1,25 @@
+# Generated by Django 5.1.15 on 2026-10-17 12:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("products", "0006_variant_stock_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="productvariant",
+            name="products_variant_stock_idx",
+        ),
+        migrations.AddIndex(
+            model_name="productvariant",
+            index=models.Index(
+                condition=models.Q(("is_active", True), ("is_deleted", False)),
+                fields=["stock_quantity", "low_stock_threshold"],
+                name="products_variant_stock_idx",
+            ),
+        ),
+    ]
@@ -416,6 +416,8 @@ class Category(SEOModel, SortableModel, SoftDeleteModel):
         indexes = [
             models.Index(fields=["parent", "status"]),
             models.Index(fields=["status", "sort_order"]),
+            # Matches default ordering
+            models.Index(fields=["sort_order", "name"], name="products_category_sort_idx"),
         ]
 
     def __str__(self) -> str:
@@ -609,6 +611,12 @@ class Product(SEOModel, SoftDeleteModel, TimeStampedModel):
             models.Index(fields=["category", "status"]),
             models.Index(fields=["is_featured", "status"]),
             models.Index(fields=["-created_at"]),
+            # Storefront listing: published products, newest first
+            models.Index(
+                fields=["-created_at"],
+                condition=models.Q(status="published"),
+                name="products_product_pub_idx",
+            ),
         ]
 
     def __str__(self) -> str:
@@ -765,6 +773,14 @@ class ProductVariant(SoftDeleteModel, TimeStampedModel):
         indexes = [
             models.Index(fields=["product", "is_active"]),
             models.Index(fields=["stock_quantity"]),
+            # Sellable variants by stock; the low-stock alert scan walks
+            # this in order and stops at its LIMIT. The threshold column
+            # lets it test stock <= threshold before visiting the table.
+            models.Index(
+                fields=["stock_quantity", "low_stock_threshold"],
+                condition=models.Q(is_active=True, is_deleted=False),
+                name="products_variant_stock_idx",
+            ),
         ]
 
     def __str__(self) -> str:
@@ -938,6 +954,13 @@ class ProductImage(SortableModel, TimeStampedModel):
         verbose_name = "Product Image"
         verbose_name_plural = "Product Images"
         ordering = ["sort_order", "-created_at"]
+        indexes = [
+            # Images are listed per product in default ordering
+            models.Index(
+                fields=["product", "sort_order", "-created_at"],
+                name="products_image_sort_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         if self.variant:
@@ -10,7 +10,7 @@ from typing import Any
 
 from django.db import transaction
 
-from apps.core.utils import generate_sku
+from apps.core.utils import generate_skus
 from apps.products.models import (
     Attribute,
     Product,
@@ -119,25 +119,19 @@ class VariantGeneratorService:
         created_variants = []
         price = base_price if base_price is not None else self.product.base_price
 
-        for combination in combinations:
-            # Build variant name and SKU from combination
-            variant_name_parts = []
-            sku_attributes = {}
+        # Generate SKUs with product prefix and variant attributes,
+        # drawing all random suffixes at once
+        skus = generate_skus(
+            prefix=self.product.slug[:4],
+            attribute_sets=[
+                dict(zip(attribute_values.keys(), combination))
+                for combination in combinations
+            ],
+        )
 
-            # Map combination values to their attribute codes
-            for idx, (attr_code, values) in enumerate(attribute_values.items()):
-                value = combination[idx]
-                variant_name_parts.append(value)
-                sku_attributes[attr_code] = value
-
-            variant_name = " - ".join(variant_name_parts)
-            
-            # Generate SKU with product prefix and variant attributes
-            sku = generate_sku(
-                prefix=self.product.slug[:4],
-                attributes=sku_attributes,
-                random_suffix=True
-            )
+        for combination, sku in zip(combinations, skus):
+            # Build variant name from combination
+            variant_name = " - ".join(combination)
 
             # Check if variant already exists
             if ProductVariant.objects.filter(sku=sku).exists():
@@ -223,6 +217,4 @@ class VariantGeneratorService:
             count = service.delete_all_variants()
             # Deleted 6 variants
         """
-        count = self.product.variants.filter(is_deleted=False).count()
-        self.product.variants.filter(is_deleted=False).update(is_deleted=True)
-        return count
+        return ProductVariant.bulk_soft_delete(self.product.variants.all())
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.15 on 2026-10-17 12:46
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0002_user_date_joined_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="user",
+            name="public_id",
+            field=models.UUIDField(
+                default=uuid.uuid4,
+                editable=False,
+                help_text="Public identifier for API responses.",
+                unique=True,
+                verbose_name="Public ID",
+            ),
+        ),
+    ]
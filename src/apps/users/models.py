@@ -77,7 +77,6 @@ class User(AbstractUser):
         default=uuid.uuid4,
         editable=False,
         unique=True,
-        db_index=True,
         help_text="Public identifier for API responses.",
     )
 
@@ -165,6 +164,8 @@ class User(AbstractUser):
             models.Index(fields=["phone"]),
             models.Index(fields=["is_staff", "is_active"]),
             models.Index(fields=["is_blocked"]),
+            # Default ordering and new-customer counts by signup date
+            models.Index(fields=["-date_joined"], name="users_date_joined_idx"),
         ]
 
     def __str__(self) -> str:
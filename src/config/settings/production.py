@@ -254,6 +254,13 @@ CACHES = {
     }
 }
 
+# =============================================================================
+# Admin Dashboard (Production)
+# =============================================================================
+# Dashboard aggregations run on this many threads, each with its own
+# database connection; set to 1 to run them serially
+DASHBOARD_QUERY_WORKERS = env.int("DASHBOARD_QUERY_WORKERS", default=5)
+
 # =============================================================================
 # Additional Security Settings
 # =============================================================================
@@ -0,0 +1,25 @@
+"""
+Django Test Settings.
+
+This module extends development settings with overrides that make the
+test suite faster. Nothing here is suitable for a running site.
+
+Features enabled:
+    - Fast (insecure) password hashing so creating users is cheap
+
+Usage:
+    DJANGO_SETTINGS_MODULE=config.settings.test python manage.py test
+"""
+
+from .development import *  # noqa: F401, F403
+
+# =============================================================================
+# Password Hashing
+# =============================================================================
+# Argon2/PBKDF2 dominate the cost of User.objects.create_user() in tests.
+# MD5 is insecure and must never be used outside the test suite.
+# =============================================================================
+
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.MD5PasswordHasher",
+]
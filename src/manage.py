@@ -17,7 +17,8 @@ Common Commands:
     test            - Run tests
 
 Environment:
-    DJANGO_SETTINGS_MODULE: Settings module to use (default: config.settings.development)
+    DJANGO_SETTINGS_MODULE: Settings module to use (default: config.settings.development,
+        or config.settings.test for the `test` command)
 """
 
 import os
@@ -36,6 +37,8 @@ def main() -> None:
     """
     # Set default settings module if not already set
     # In production, this should be overridden via environment variable
+    if len(sys.argv) > 1 and sys.argv[1] == "test":
+        os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.test")
     os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.development")
     
     try: